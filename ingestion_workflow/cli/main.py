@@ -61,6 +61,11 @@ def run(
         "--use-cached-inputs/--no-use-cached-inputs",
         help="Toggle hydration from cached outputs when stages are skipped.",
     ),
+    idconv_cache: Optional[bool] = typer.Option(
+        None,
+        "--idconv-cache/--no-idconv-cache",
+        help="Toggle the persistent PubMed ID Converter cache.",
+    ),
 ) -> None:
     """Run the orchestrated ingestion workflow pipeline."""
 
@@ -71,6 +76,8 @@ def run(
         overrides["manifest_path"] = manifest_path
     if use_cached_inputs is not None:
         overrides["use_cached_inputs"] = use_cached_inputs
+    if idconv_cache is not None:
+        overrides["pubmed_idconv_cache"] = idconv_cache
     settings = load_settings(config_path, overrides=overrides or None)
     run_pipeline(settings=settings)
 
@@ -327,7 +334,7 @@ def create_analyses(
         overrides["n_llm_workers"] = max(1, n_llm_workers)
     if overrides:
         settings = settings.merge_overrides(overrides)
-    payload = json.loads(bundles_path.read_text(encoding="utf-8"))
+    payload = json.loads(bundles_path.read_bytes())
     bundles = _load_bundles(payload)
     results = create_analyses_workflow.run_create_analyses(
         bundles,
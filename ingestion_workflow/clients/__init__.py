@@ -1,10 +1,16 @@
 """HTTP clients for external literature services."""
 
-from .coordinate_parsing import CoordinateParsingClient
-from .llm import GenericLLMClient
-from .openalex import OpenAlexClient
-from .pubmed import PubMedClient
-from .semantic_scholar import SemanticScholarClient
+import importlib
+
+# Client classes are imported lazily (PEP 562) so that pulling in one client
+# does not pay the import cost of the others' dependencies (openai, etc.).
+_LAZY_CLIENTS = {
+    "CoordinateParsingClient": ".coordinate_parsing",
+    "GenericLLMClient": ".llm",
+    "OpenAlexClient": ".openalex",
+    "PubMedClient": ".pubmed",
+    "SemanticScholarClient": ".semantic_scholar",
+}
 
 __all__ = [
     "CoordinateParsingClient",
@@ -13,3 +19,17 @@ __all__ = [
     "PubMedClient",
     "SemanticScholarClient",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_CLIENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
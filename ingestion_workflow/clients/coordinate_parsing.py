@@ -4,15 +4,28 @@ from __future__ import annotations
 
 import json
 import logging
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 from ingestion_workflow.clients.llm import GenericLLMClient
 from ingestion_workflow.config import Settings
 from ingestion_workflow.models.coordinate_parsing import ParseAnalysesOutput
 
-
 logger = logging.getLogger(__name__)
 
+# Exact type checks keep point validation on a fast path; LLM output arrives as
+# plain JSON scalars, so subclasses do not need to be honored here.
+_COORD_TYPES = (int, float)
+
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are a helpful assistant that parses neuroimaging "
+        "results tables into structured JSON for downstream analysis. "
+        "Respond using the parse_analyses function."
+    ),
+}
+
 
 class CoordinateParsingClient(GenericLLMClient):
     """Client responsible for parsing coordinate tables via LLM."""
@@ -32,6 +45,22 @@ class CoordinateParsingClient(GenericLLMClient):
             default_model=default_model,
         )
 
+    @cached_property
+    def function_schema(self) -> Dict[str, Any]:
+        """Function-call schema for ParseAnalysesOutput, built once per client."""
+        return self._generate_function_schema(ParseAnalysesOutput, "parse_analyses")
+
+    def _completion_kwargs(self, model: str, prompt: str) -> Dict[str, Any]:
+        return {
+            "model": model,
+            "messages": [
+                _SYSTEM_MESSAGE,
+                {"role": "user", "content": prompt},
+            ],
+            "functions": [self.function_schema],
+            "function_call": {"name": "parse_analyses"},
+        }
+
     def parse_analyses(
         self,
         prompt: str,
@@ -40,42 +69,29 @@ class CoordinateParsingClient(GenericLLMClient):
     ) -> ParseAnalysesOutput:
         """Parse a neuroimaging table into structured analyses."""
         resolved_model = model or self.default_model
-        function_schema = self._generate_function_schema(
-            ParseAnalysesOutput,
-            "parse_analyses",
-        )
         response = self.client.chat.completions.create(
-            model=resolved_model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a helpful assistant that parses neuroimaging "
-                        "results tables into structured JSON for downstream analysis. "
-                        "Respond using the parse_analyses function."
-                    ),
-                },
-                {"role": "user", "content": prompt},
-            ],
-            functions=[function_schema],
-            function_call={"name": "parse_analyses"},
+            **self._completion_kwargs(resolved_model, prompt)
         )
+        return self._build_output(response)
+
+    def _build_output(self, response) -> ParseAnalysesOutput:
         function_call = response.choices[0].message.function_call
         if not function_call:
             raise ValueError("No function call returned from API")
 
         result_dict = json.loads(function_call.arguments)
-        for analysis in result_dict.get("analyses", []):
-            valid_points: List[Dict[str, Any]] = []
-            for point in analysis.get("points", []):
-                coordinates = point.get("coordinates")
-                if (
-                    isinstance(coordinates, list)
-                    and len(coordinates) == 3
-                    and all(isinstance(coord, (int, float)) for coord in coordinates)
-                ):
-                    valid_points.append(point)
-            analysis["points"] = valid_points
+        for analysis in result_dict.get("analyses", ()):
+            points = analysis.get("points") or ()
+            analysis["points"] = [
+                point
+                for point in points
+                if (coords := point.get("coordinates")) is not None
+                and type(coords) is list
+                and len(coords) == 3
+                and type(coords[0]) in _COORD_TYPES
+                and type(coords[1]) in _COORD_TYPES
+                and type(coords[2]) in _COORD_TYPES
+            ]
         _coerce_point_values_schema(result_dict)
         try:
             return ParseAnalysesOutput(**result_dict)
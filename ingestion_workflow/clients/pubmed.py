@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import re
+import sqlite3
+import threading
 import time
 from datetime import datetime
+from operator import attrgetter
+from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
-import requests
+import httpx
 import xmltodict
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -15,9 +22,128 @@ from ingestion_workflow.models.metadata import ArticleMetadata, Author
 
 IDCONV_BATCH_SIZE = 200
 PUBMED_REQUEST_LIMIT = 3  # requests per second (polite throttle)
-_MIN_REQUEST_INTERVAL = 1 / PUBMED_REQUEST_LIMIT
+IDCONV_MAX_CONCURRENCY = PUBMED_REQUEST_LIMIT
 ESEARCH_MAX_RESULTS = 10_000
 ESEARCH_CHUNK_SIZE = 1_000
+_EXTRA_ID_FIELDS = ("mid", "aiid", "version", "release-date")
+IDCONV_CACHE_FILENAME = "idconv_cache.db"
+_YEAR_RE = re.compile(r"(19|20)\d{2}")
+
+
+def _s(value: object) -> str:
+    # The API returns strings for the common case; skipping str() there avoids
+    # a no-op allocation per field across every record.
+    return value if type(value) is str else str(value)
+
+
+def _rejected_batch_size(exc: BaseException) -> bool:
+    """Return True when the server refused a request for being too large."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in (413, 414)
+    return False
+
+
+class _TokenBucket:
+    """Token bucket that caps the average request rate while allowing bursts.
+
+    Safe to share between threads and coroutines: the lock only guards the
+    bookkeeping, and callers perform the sleep themselves (blocking or async).
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self._rate = rate
+        self._capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._updated) * self._rate,
+            )
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def wait_sync(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class _IdConvDiskCache:
+    """SQLite store of ID Converter records keyed by requested id.
+
+    Resolved conversions become durable across runs, so repeat pipelines skip
+    the network entirely for identifiers that were already looked up.
+    """
+
+    # Stay well below SQLite's default bound-parameter limit per statement.
+    _SELECT_CHUNK = 500
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL;")
+        self._conn.execute("PRAGMA synchronous=NORMAL;")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "requested_id TEXT PRIMARY KEY, "
+            "id_type TEXT, "
+            "payload BLOB, "
+            "ts INTEGER)"
+        )
+        self._conn.commit()
+
+    def get_records(self, values: Sequence[str]) -> Dict[str, Dict[str, object]]:
+        """Return decoded records for every cached value among ``values``."""
+        hits: Dict[str, Dict[str, object]] = {}
+        for start in range(0, len(values), self._SELECT_CHUNK):
+            chunk = values[start : start + self._SELECT_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                "SELECT requested_id, payload FROM cache "
+                f"WHERE requested_id IN ({placeholders})",
+                list(chunk),
+            )
+            for requested_id, payload in rows:
+                hits[requested_id] = json.loads(payload)
+        return hits
+
+    def store_records(
+        self,
+        id_type: str,
+        records: Iterable[Dict[str, object]],
+    ) -> None:
+        """Persist successful conversion records keyed by their requested id."""
+        now = int(time.time())
+        entries = [
+            (str(requested_id), id_type, json.dumps(record), now)
+            for record in records
+            if type(record) is dict
+            and (requested_id := record.get("requested-id"))
+            and record.get("status") != "error"
+            and not record.get("error")
+        ]
+        if not entries:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO cache (requested_id, id_type, payload, ts) "
+            "VALUES (?, ?, ?, ?)",
+            entries,
+        )
+        self._conn.commit()
 
 
 class PubMedClient:
@@ -27,13 +153,39 @@ class PubMedClient:
     EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
     BASE_URL = "https://pmc.ncbi.nlm.nih.gov/tools/idconv/api/v1/articles/"
     _SUPPORTED_ID_TYPES = {"pmid", "pmcid", "doi"}
+    _client: Optional[httpx.Client] = None
 
-    def __init__(self, email: str, api_key: str = None, tool: str = "ingestion-workflow") -> None:
+    def __init__(
+        self,
+        email: str,
+        api_key: str = None,
+        tool: str = "ingestion-workflow",
+        batch_size: Optional[int] = None,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
         self.email = email
         self.api_key = api_key
         self.tool = tool
-        self._session = requests.Session()
-        self._last_request = 0.0
+        self.batch_size = batch_size or IDCONV_BATCH_SIZE
+        self._limiter = _TokenBucket(PUBMED_REQUEST_LIMIT, PUBMED_REQUEST_LIMIT)
+        self._idconv_cache: Dict[Tuple[str, str], List[Dict[str, object]]] = {}
+        self._disk_cache: Optional[_IdConvDiskCache] = None
+        if cache_dir is not None:
+            self._disk_cache = _IdConvDiskCache(Path(cache_dir) / IDCONV_CACHE_FILENAME)
+
+    @classmethod
+    def _get_client(cls) -> httpx.Client:
+        """Return a keep-alive connection pool shared across client instances."""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.Client(
+                headers={"Connection": "keep-alive"},
+                limits=httpx.Limits(
+                    max_connections=PUBMED_REQUEST_LIMIT,
+                    max_keepalive_connections=PUBMED_REQUEST_LIMIT,
+                ),
+                timeout=30,
+            )
+        return cls._client
 
     def get_ids(self, id_type: str, identifiers: Identifiers) -> Identifiers:
         """Fetch additional identifiers for the provided collection."""
@@ -75,7 +227,9 @@ class PubMedClient:
         if id_type not in self._SUPPORTED_ID_TYPES:
             raise ValueError("PubMed ID lookups support only 'pmid', 'pmcid', or 'doi'.")
 
-        if any(getattr(identifier, id_type) is None for identifier in identifiers):
+        # `None in map(...)` runs the scan at C level instead of driving a
+        # generator through the interpreter for every identifier.
+        if None in map(attrgetter(id_type), identifiers):
             raise ValueError(f"All identifiers must provide a {id_type.upper()} for lookup.")
 
     def get_ids_by_type(
@@ -88,29 +242,88 @@ class PubMedClient:
         if not values:
             return identifiers
 
+        if self._disk_cache is not None:
+            cached = self._disk_cache.get_records(values)
+            if cached:
+                self._apply_records(id_type, identifiers, cached.values())
+                values = [value for value in values if value not in cached]
+            if not values:
+                return identifiers
+
+        batch_size = self.batch_size
         batches = [
-            values[index : index + IDCONV_BATCH_SIZE]
-            for index in range(0, len(values), IDCONV_BATCH_SIZE)
+            values[index : index + batch_size]
+            for index in range(0, len(values), batch_size)
         ]
 
-        for batch in batches:
-            params = self._build_params(id_type, batch)
-            payload = self._request_idconv(params)
-            records = payload.get("records", [])
+        fetched: List[Dict[str, object]] = []
+        for records in asyncio.run(self._gather_idconv(id_type, batches)):
             self._apply_records(id_type, identifiers, records)
+            fetched.extend(records)
+
+        if self._disk_cache is not None and fetched:
+            self._disk_cache.store_records(id_type, fetched)
 
         return identifiers
 
+    async def _gather_idconv(
+        self,
+        id_type: str,
+        batches: Sequence[Sequence[str]],
+    ) -> List[List[Dict[str, object]]]:
+        """Issue ID Converter batches concurrently while honoring the rate limit."""
+        semaphore = asyncio.Semaphore(IDCONV_MAX_CONCURRENCY)
+
+        limits = httpx.Limits(
+            max_connections=IDCONV_MAX_CONCURRENCY,
+            max_keepalive_connections=IDCONV_MAX_CONCURRENCY,
+        )
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+
+            async def fetch(batch: Sequence[str]) -> List[Dict[str, object]]:
+                cache_key = (id_type, ",".join(batch))
+                cached = self._idconv_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+                params = self._build_params(id_type, batch)
+                try:
+                    async with semaphore:
+                        payload = await self._request_idconv(client, params)
+                except httpx.HTTPStatusError as exc:
+                    if _rejected_batch_size(exc) and len(batch) > 1:
+                        # Server rejected the batch as too large; halve it for
+                        # this request and shrink future batches to match.
+                        half = len(batch) // 2
+                        self.batch_size = max(1, min(self.batch_size, half))
+                        first = await fetch(batch[:half])
+                        second = await fetch(batch[half:])
+                        return first + second
+                    raise
+                # Only the records are consumed downstream; dropping the rest
+                # of the payload keeps the cache and gather results small.
+                records = payload.get("records", [])
+                self._idconv_cache[cache_key] = records
+                return records
+
+            return list(await asyncio.gather(*(fetch(batch) for batch in batches)))
+
     def _collect_values(
         self,
         id_type: str,
         identifiers: Identifiers,
     ) -> list[str]:
-        return [
-            str(getattr(identifier, id_type)).strip()
-            for identifier in identifiers
-            if getattr(identifier, id_type)
-        ]
+        # Single pass: attrgetter avoids the duplicated getattr per identifier,
+        # and dict.fromkeys keeps first-seen order while dropping repeats so the
+        # same ID is never sent twice in one run.
+        get = attrgetter(id_type)
+        return list(
+            dict.fromkeys(
+                stripped
+                for identifier in identifiers
+                if (value := get(identifier)) and (stripped := str(value).strip())
+            )
+        )
 
     def _build_params(
         self,
@@ -139,60 +352,57 @@ class PubMedClient:
         identifiers: Identifiers,
         records: Iterable[Dict[str, object]],
     ) -> None:
-        for record in records or []:
-            if not isinstance(record, dict):
+        # One O(N) pass builds a direct value->identifier map so each record is
+        # resolved with a dict probe instead of an Identifiers.lookup call.
+        # PMCIDs are indexed under both the canonical and the bare numeric form
+        # so records echoed without the PMC prefix resolve on the same probe.
+        by_id: Dict[str, Identifier] = {}
+        is_pmcid = id_type == "pmcid"
+        for identifier in identifiers:
+            value = getattr(identifier, id_type)
+            if value:
+                value = _s(value)
+                by_id[value] = identifier
+                if is_pmcid and value[:3] == "PMC":
+                    by_id[value[3:]] = identifier
+
+        for record in records or ():
+            if type(record) is not dict:
                 continue
-            if record.get("status") == "error" or record.get("error"):
+            get = record.get
+            if get("status") == "error" or get("error"):
                 continue
 
-            requested_id = record.get("requested-id")
+            requested_id = get("requested-id")
             if not requested_id:
                 continue
 
-            identifier = identifiers.lookup(str(requested_id), key=id_type)
-            if identifier is None and id_type == "pmcid":
-                lookup_value = str(requested_id)
-                if not lookup_value.upper().startswith("PMC"):
-                    lookup_value = f"PMC{lookup_value}"
-                identifier = identifiers.lookup(lookup_value, key="pmcid")
-
+            identifier = by_id.get(_s(requested_id))
             if identifier is None:
                 continue
 
-            pmid = record.get("pmid")
-            if pmid and identifier.pmid is None:
-                identifier.pmid = str(pmid)
-
-            pmcid = record.get("pmcid")
-            if pmcid and identifier.pmcid is None:
-                identifier.pmcid = str(pmcid)
-
-            doi = record.get("doi")
-            if doi and identifier.doi is None:
-                identifier.doi = str(doi)
+            if (pmid := get("pmid")) and identifier.pmid is None:
+                identifier.pmid = _s(pmid)
+            if (pmcid := get("pmcid")) and identifier.pmcid is None:
+                identifier.pmcid = _s(pmcid)
+            if (doi := get("doi")) and identifier.doi is None:
+                identifier.doi = _s(doi)
 
             self._store_extra_metadata(identifier, record)
 
     @staticmethod
     def _store_extra_metadata(identifier, record: Dict[str, object]) -> None:
-        extra_fields = ("mid", "aiid", "version", "release-date")
-
-        for field in extra_fields:
+        for field in _EXTRA_ID_FIELDS:
             value = record.get(field)
             if not value:
                 continue
 
-            if identifier.other_ids is None:
-                identifier.other_ids = {}
-
-            identifier.other_ids.setdefault(field, str(value))
+            other_ids = identifier.other_ids
+            if other_ids is None:
+                other_ids = identifier.other_ids = {}
 
-    def _rate_limit_sleep(self) -> None:
-        now = time.monotonic()
-        elapsed = now - self._last_request
-        if elapsed < _MIN_REQUEST_INTERVAL:
-            time.sleep(_MIN_REQUEST_INTERVAL - elapsed)
-        self._last_request = time.monotonic()
+            if field not in other_ids:
+                other_ids[field] = _s(value)
 
     def _collect_esearch_ids(
         self,
@@ -265,23 +475,36 @@ class PubMedClient:
     def _current_year(self) -> int:
         return datetime.utcnow().year
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, max=8),
-    )
-    def _request_idconv(
+    async def _request_idconv(
         self,
+        client: httpx.AsyncClient,
         params: Sequence[Tuple[str, str]],
     ) -> Dict[str, object]:
-        return self._request_json(self.BASE_URL, params)
+        # Inline retry loop instead of tenacity: no per-call RetryCallState
+        # bookkeeping, and 4xx responses other than 429 fail fast because
+        # resending the same request cannot fix them.
+        for attempt in range(3):
+            await self._limiter.wait_async()
+            try:
+                response = await client.get(self.BASE_URL, params=params)
+                response.raise_for_status()
+                return response.json()
+            except httpx.HTTPStatusError as exc:
+                status = exc.response.status_code
+                if attempt == 2 or (status != 429 and status < 500):
+                    raise
+            except httpx.HTTPError:
+                if attempt == 2:
+                    raise
+            await asyncio.sleep(min(8, 2**attempt))
 
     def _request_json(
         self,
         url: str,
         params: Mapping[str, str] | Sequence[Tuple[str, str]],
     ) -> Dict[str, object]:
-        self._rate_limit_sleep()
-        response = self._session.get(url, params=params, timeout=30)
+        self._limiter.wait_sync()
+        response = self._get_client().get(url, params=params)
         response.raise_for_status()
         return response.json()
 
@@ -290,8 +513,8 @@ class PubMedClient:
         url: str,
         params: Mapping[str, str] | Sequence[Tuple[str, str]],
     ) -> Dict[str, Any]:
-        self._rate_limit_sleep()
-        response = self._session.get(url, params=params, timeout=30)
+        self._limiter.wait_sync()
+        response = self._get_client().get(url, params=params)
         response.raise_for_status()
         return xmltodict.parse(response.text)
 
@@ -324,7 +547,7 @@ class PubMedClient:
         # Batch requests
         results: Dict[str, ArticleMetadata] = {}
         pmids = list(pmid_map.keys())
-        batch_size = IDCONV_BATCH_SIZE
+        batch_size = self.batch_size
 
         for i in range(0, len(pmids), batch_size):
             batch = pmids[i : i + batch_size]
@@ -531,9 +754,7 @@ class PubMedClient:
 
     @staticmethod
     def _extract_year_from_string(value: str) -> Optional[int]:
-        import re
-
-        match = re.search(r"(19|20)\d{2}", value or "")
+        match = _YEAR_RE.search(value or "")
         if match:
             return int(match.group(0))
         return None
@@ -8,6 +8,7 @@ There are three levels of configuration in order of priority
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -19,6 +20,10 @@ from ingestion_workflow.models import (
     DownloadSource,
 )
 
+# Cache directories already created by this process; lets get_cache_dir
+# skip the mkdir stat walk on every call after the first per path.
+_ENSURED_CACHE_DIRS: set[Path] = set()
+
 
 class Settings(BaseSettings):
     """
@@ -70,6 +75,14 @@ class Settings(BaseSettings):
         description="Number of records per PubMed API request",
     )
 
+    pubmed_idconv_cache: bool = Field(
+        default=True,
+        description=(
+            "Persist PubMed ID Converter responses under cache_root so repeat "
+            "runs skip the network for already-resolved identifiers"
+        ),
+    )
+
     # ===== External API configuration =====
     semantic_scholar_api_key: Optional[str] = Field(
         default=None,
@@ -180,9 +193,12 @@ class Settings(BaseSettings):
     )
 
     # ===== Parallelism configuration =====
-    max_workers: int = Field(
-        default=4,
-        description=("Maximum number of parallel workers for concurrent operations"),
+    max_workers: Optional[int] = Field(
+        default=None,
+        description=(
+            "Maximum number of parallel workers for concurrent operations; "
+            "defaults to the number of CPUs available to this process"
+        ),
     )
 
     ace_max_workers: int = Field(
@@ -340,6 +356,18 @@ class Settings(BaseSettings):
             if isinstance(optional_dir, Path):
                 optional_dir.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def resolved_max_workers(self) -> int:
+        """
+        Worker count with the CPU-count fallback applied.
+
+        When ``max_workers`` is unset, size worker pools to the CPUs
+        available to this process instead of a fixed constant.
+        """
+        if self.max_workers:
+            return max(1, self.max_workers)
+        return os.cpu_count() or 1
+
     def get_cache_dir(self, cache_type: str) -> Path:
         """
         Get the cache directory for a specific cache type.
@@ -355,7 +383,9 @@ class Settings(BaseSettings):
             Path to the specific cache directory
         """
         cache_path = self.cache_root / cache_type
-        cache_path.mkdir(parents=True, exist_ok=True)
+        if cache_path not in _ENSURED_CACHE_DIRS:
+            cache_path.mkdir(parents=True, exist_ok=True)
+            _ENSURED_CACHE_DIRS.add(cache_path)
         return cache_path
 
     # ===== Provider-specific cache roots =====
@@ -317,7 +317,7 @@ class ACEExtractor(BaseExtractor):
 
         worker_count = self.settings.ace_max_workers
         if worker_count <= 0:
-            worker_count = self.settings.max_workers
+            worker_count = self.settings.resolved_max_workers
         worker_count = max(1, worker_count)
 
         identifiers_list = identifiers.identifiers
@@ -386,7 +386,7 @@ class ACEExtractor(BaseExtractor):
             download_results,
             extraction_root=self._extraction_root,
             worker=_run_ace_extraction_task,
-            worker_count=self.settings.max_workers,
+            worker_count=self.settings.resolved_max_workers,
             source_name="ACE",
             failure_message="ACE extraction did not produce a result.",
             failure_builder=lambda download_result, message: build_failure_extraction(
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import logging
+import weakref
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Callable, Dict, List, Sequence
+from typing import Callable, ClassVar, List, Sequence
 
 from ingestion_workflow.models import DownloadResult, ExtractionResult, Identifiers, Identifier
 from ingestion_workflow.utils.progress import emit_progress
@@ -17,6 +18,11 @@ FailureBuilder = Callable[[DownloadResult, str], ExtractionResult]
 class BaseExtractor:
     """Shared interface for extractor implementations."""
 
+    #: Subclasses whose ``_SUPPORTED_IDS`` cover every identifier field the
+    #: pipeline can produce may set this to True so the download stage skips
+    #: the per-identifier support scan entirely.
+    _SUPPORTS_ALL: ClassVar[bool] = False
+
     def download(
         self,
         identifiers: Identifiers,
@@ -30,20 +36,45 @@ class BaseExtractor:
     @staticmethod
     def _ordered_results(
         identifiers: Identifiers,
-        results_by_index: Dict[int, DownloadResult],
+        results: Sequence[DownloadResult | None],
         default_builder: Callable[[Identifier], DownloadResult],
         *,
         progress_hook: Callable[[int], None] | None = None,
     ) -> List[DownloadResult]:
         ordered: List[DownloadResult] = []
         for index, identifier in enumerate(identifiers):
-            result = results_by_index.get(index)
+            result = results[index]
             if result is None:
                 result = default_builder(identifier)
             ordered.append(result)
             emit_progress(progress_hook)
         return ordered
 
+    def _ensure_extraction_executor(self, worker_count: int) -> ProcessPoolExecutor:
+        """Return a worker pool that is reused across ``extract`` calls.
+
+        Spawning a process pool costs a fork plus interpreter start per
+        worker; keeping the pool on the instance amortizes that over every
+        batch the extractor processes. The pool is rebuilt only when the
+        worker count changes and is shut down when the extractor is
+        garbage collected.
+        """
+        pool = getattr(self, "_extraction_pool", None)
+        if pool is not None and pool._broken:
+            # A crashed worker poisons the whole pool; drop it so the next
+            # batch gets a fresh one instead of failing in every later call.
+            pool.shutdown(wait=False)
+            pool = None
+        if pool is not None and self._extraction_pool_workers == worker_count:
+            return pool
+        if pool is not None:
+            pool.shutdown(wait=False)
+        pool = ProcessPoolExecutor(max_workers=worker_count)
+        self._extraction_pool = pool
+        self._extraction_pool_workers = worker_count
+        weakref.finalize(self, pool.shutdown, wait=False)
+        return pool
+
     def _run_extraction_pipeline(
         self,
         download_results: Sequence[DownloadResult],
@@ -76,28 +107,28 @@ class BaseExtractor:
                 emit_progress(progress_hook)
         else:
             root_arg = str(extraction_root)
-            with ProcessPoolExecutor(max_workers=worker_count) as executor:
-                future_map = {
-                    executor.submit(worker, download_result, root_arg): index
-                    for index, download_result in enumerate(download_results)
-                }
-                for future in as_completed(future_map):
-                    index = future_map[future]
-                    download_result = download_results[index]
-                    try:
-                        ordered_results[index] = future.result()
-                    except Exception as exc:  # pragma: no cover - defensive guard
-                        logger.exception(
-                            "%s extraction raised exception for %s",
-                            source_name,
-                            download_result.identifier.slug,
-                        )
-                        ordered_results[index] = failure_builder(
-                            download_result,
-                            f"{source_name} extraction raised an exception: {exc}",
-                        )
-                    finally:
-                        emit_progress(progress_hook)
+            executor = self._ensure_extraction_executor(worker_count)
+            future_map = {
+                executor.submit(worker, download_result, root_arg): index
+                for index, download_result in enumerate(download_results)
+            }
+            for future in as_completed(future_map):
+                index = future_map[future]
+                download_result = download_results[index]
+                try:
+                    ordered_results[index] = future.result()
+                except Exception as exc:  # pragma: no cover - defensive guard
+                    logger.exception(
+                        "%s extraction raised exception for %s",
+                        source_name,
+                        download_result.identifier.slug,
+                    )
+                    ordered_results[index] = failure_builder(
+                        download_result,
+                        f"{source_name} extraction raised an exception: {exc}",
+                    )
+                finally:
+                    emit_progress(progress_hook)
 
         final_results: List[ExtractionResult] = []
         for index, download_result in enumerate(download_results):
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import contextlib
 import hashlib
 import json
@@ -10,6 +11,8 @@ import logging
 import math
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from collections import deque
 from typing import Any, Callable, Deque, Dict, Iterable, List, Mapping, Optional, Tuple
@@ -59,6 +62,35 @@ from ingestion_workflow.utils.progress import emit_progress
 
 logger = logging.getLogger(__name__)
 
+# Shared parser: skips entity resolution and xml:id collection we never use,
+# and avoids rebuilding parser state for every article.
+_XML_PARSER = etree.XMLParser(resolve_entities=False, collect_ids=False)
+
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    # Write through a raw descriptor: Path.write_bytes goes through a
+    # buffered writer whose flush/close bookkeeping adds up when emitting
+    # thousands of small artifacts per run.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _dump_json(path: Path, obj: Any, **kwargs: Any) -> bytes:
+    # Serialize once and write bytes directly, skipping the buffered
+    # text-wrapper layer that Path.write_text sets up per call. The written
+    # bytes are returned so callers can hash them without a read-back.
+    data = json.dumps(obj, indent=2, **kwargs).encode("utf-8")
+    _write_bytes(path, data)
+    return data
+
 
 class ElsevierExtractor(BaseExtractor):
     """Extractor that uses Elsevier to download and extract article content."""
@@ -91,10 +123,19 @@ class ElsevierExtractor(BaseExtractor):
         *,
         client: ScienceDirectClient | None = None,
         cache: Any | None = None,
+        downloader: Callable[..., Any] | None = None,
     ) -> None:
         self.settings = settings or load_settings()
         self._client = client
         self._cache = cache
+        # Injection seam for tests and callers that want to swap the batch
+        # download coroutine without patching module state.
+        self._downloader = downloader or download_articles
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._owned_client: ScienceDirectClient | None = None
+        self._elsevier_settings: ElsevierSettings | None = None
+        self._ensured_dirs: set[Path] = set()
 
     def download(
         self,
@@ -108,7 +149,13 @@ class ElsevierExtractor(BaseExtractor):
 
         prepared: List[Tuple[int, Identifier, Dict[str, str]]] = []
         records: List[Dict[str, str]] = []
-        results_by_index: Dict[int, DownloadResult] = {}
+        results: List[Optional[DownloadResult]] = [None] * len(identifiers.identifiers)
+
+        def default_builder(identifier: Identifier) -> DownloadResult:
+            return self._build_failure_result(
+                identifier=identifier,
+                error_message="Elsevier download did not produce a result.",
+            )
 
         for index, identifier in enumerate(identifiers):
             record = self._record_from_identifier(identifier)
@@ -116,7 +163,7 @@ class ElsevierExtractor(BaseExtractor):
                 prepared.append((index, identifier, record))
                 records.append(record)
             else:
-                results_by_index[index] = self._build_failure_result(
+                results[index] = self._build_failure_result(
                     identifier=identifier,
                     error_message=(
                         "Identifier is missing a DOI or PMID required for Elsevier download."
@@ -124,13 +171,9 @@ class ElsevierExtractor(BaseExtractor):
                 )
 
         if not prepared:
-            default_builder = lambda identifier: self._build_failure_result(  # noqa: E731
-                identifier=identifier,
-                error_message="Elsevier download did not produce a result.",
-            )
             return self._ordered_results(
                 identifiers,
-                results_by_index,
+                results,
                 default_builder,
                 progress_hook=progress_hook,
             )
@@ -140,17 +183,13 @@ class ElsevierExtractor(BaseExtractor):
         except Exception as exc:  # pragma: no cover - surfaced to caller
             failure_reason = str(exc) or "Unknown Elsevier download failure."
             for original_index, identifier, _ in prepared:
-                results_by_index[original_index] = self._build_failure_result(
+                results[original_index] = self._build_failure_result(
                     identifier=identifier,
                     error_message=failure_reason,
                 )
-            default_builder = lambda identifier: self._build_failure_result(  # noqa: E731
-                identifier=identifier,
-                error_message="Elsevier download did not produce a result.",
-            )
             return self._ordered_results(
                 identifiers,
-                results_by_index,
+                results,
                 default_builder,
                 progress_hook=progress_hook,
             )
@@ -158,11 +197,13 @@ class ElsevierExtractor(BaseExtractor):
         base_dir = Path(
             self.settings.elsevier_cache_root or self.settings.get_cache_dir("elsevier")
         )
-        base_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(base_dir)
 
+        # Each queue entry carries the extracted metadata dict so the matching
+        # loop and persistence reuse it instead of re-extracting per article.
         articles_by_lookup: Dict[
             Tuple[str | None, str | None],
-            Deque[Any],
+            Deque[Tuple[Any, Dict[str, Any]]],
         ] = {}
         for article in articles:
             metadata = self._extract_metadata(article)
@@ -173,8 +214,11 @@ class ElsevierExtractor(BaseExtractor):
                 identifier_value = metadata.get("identifier")
                 if identifier_type and identifier_value:
                     lookup_key = self._lookup_key({str(identifier_type): str(identifier_value)})
-            articles_by_lookup.setdefault(lookup_key, deque()).append(article)
+            articles_by_lookup.setdefault(lookup_key, deque()).append((article, metadata))
 
+        # Article matching mutates the lookup queues, so it stays serial; the
+        # persistence work per article is independent and runs on a pool below.
+        tasks: List[Tuple[int, Dict[str, Any]]] = []
         for prepared_index, (
             original_index,
             identifier,
@@ -185,15 +229,15 @@ class ElsevierExtractor(BaseExtractor):
             lookup_key = self._lookup_key(record)
             queue = articles_by_lookup.get(lookup_key)
             article = None
+            article_metadata: Dict[str, Any] | None = None
             if queue:
-                article = queue.popleft()
+                article, article_metadata = queue.popleft()
                 if not queue:
                     articles_by_lookup.pop(lookup_key, None)
 
             actual_lookup_type = lookup_type
             actual_lookup_value = lookup_value
-            if article is not None:
-                article_metadata = self._extract_metadata(article)
+            if article_metadata is not None:
                 metadata_type = article_metadata.get("identifier_type")
                 metadata_value = article_metadata.get("identifier")
                 if metadata_type:
@@ -201,25 +245,58 @@ class ElsevierExtractor(BaseExtractor):
                 if metadata_value:
                     actual_lookup_value = str(metadata_value)
 
-            results_by_index[original_index] = self._build_download_result(
-                base_dir=base_dir,
-                cache_key=cache_key,
-                identifier=identifier,
-                record=record,
-                article=article,
-                index=prepared_index,
-                lookup_type=actual_lookup_type,
-                lookup_value=actual_lookup_value,
+            tasks.append(
+                (
+                    original_index,
+                    dict(
+                        base_dir=base_dir,
+                        cache_key=cache_key,
+                        identifier=identifier,
+                        record=record,
+                        article=article,
+                        metadata=article_metadata,
+                        index=prepared_index,
+                        lookup_type=actual_lookup_type,
+                        lookup_value=actual_lookup_value,
+                    ),
+                )
             )
-            emit_progress(progress_hook)
 
-        default_builder = lambda identifier: self._build_failure_result(  # noqa: E731
-            identifier=identifier,
-            error_message="Elsevier download did not produce a result.",
-        )
+        worker_count = self.settings.resolved_max_workers
+        if worker_count == 1 or len(tasks) == 1:
+            for original_index, kwargs in tasks:
+                results[original_index] = self._build_download_result(**kwargs)
+                emit_progress(progress_hook)
+        else:
+            # Threads suffice here: the work is filesystem writes and lxml
+            # parsing, both of which release the GIL.
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                future_map = {
+                    executor.submit(self._build_download_result, **kwargs): (
+                        original_index,
+                        kwargs["identifier"],
+                    )
+                    for original_index, kwargs in tasks
+                }
+                for future in as_completed(future_map):
+                    original_index, identifier = future_map[future]
+                    try:
+                        results[original_index] = future.result()
+                    except Exception as exc:  # pragma: no cover - defensive guard
+                        logger.exception(
+                            "Elsevier persistence raised exception for %s",
+                            identifier.slug,
+                        )
+                        results[original_index] = self._build_failure_result(
+                            identifier=identifier,
+                            error_message=f"Elsevier persistence raised an exception: {exc}",
+                        )
+                    finally:
+                        emit_progress(progress_hook)
+
         return self._ordered_results(
             identifiers,
-            results_by_index,
+            results,
             default_builder,
         )
 
@@ -233,7 +310,7 @@ class ElsevierExtractor(BaseExtractor):
             download_results,
             extraction_root=self._resolve_extraction_root(),
             worker=_run_elsevier_extraction_task,
-            worker_count=self.settings.max_workers,
+            worker_count=self.settings.resolved_max_workers,
             source_name="Elsevier",
             failure_message="Elsevier extraction did not produce a result.",
             failure_builder=lambda download_result, message: build_failure_extraction(
@@ -247,9 +324,16 @@ class ElsevierExtractor(BaseExtractor):
     def _resolve_extraction_root(self) -> Path:
         base = self.settings.get_cache_dir("extract")
         root = base / "elsevier"
-        root.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(root)
         return root
 
+    def _ensure_dir(self, path: Path) -> None:
+        """mkdir -p once per directory; repeat calls skip the stat walk."""
+        if path in self._ensured_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(path)
+
     def _run_download(
         self,
         records: List[Dict[str, str]],
@@ -258,35 +342,74 @@ class ElsevierExtractor(BaseExtractor):
         elsevier_settings = self._build_elsevier_settings()
         progress_proxy = _build_progress_callback(progress_hook) if progress_hook else None
 
-        async def _runner() -> List[Any]:
-            if self._client is None:
-                async with ScienceDirectClient(elsevier_settings) as client:
-                    return await download_articles(
-                        records,
-                        client=client,
-                        cache=self._cache,
-                        settings=elsevier_settings,
-                        progress_callback=progress_proxy,
-                    )
-            return await download_articles(
+        # Batches run on a long-lived background loop so the client's
+        # keep-alive connections, TLS sessions, and DNS cache survive across
+        # download() calls instead of being torn down with asyncio.run.
+        loop = self._ensure_loop()
+        client = self._client or self._ensure_owned_client(elsevier_settings)
+        future = asyncio.run_coroutine_threadsafe(
+            self._downloader(
                 records,
-                client=self._client,
+                client=client,
                 cache=self._cache,
                 settings=elsevier_settings,
                 progress_callback=progress_proxy,
+            ),
+            loop,
+        )
+        return future.result()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="elsevier-download-loop",
+                daemon=True,
             )
+            thread.start()
+            self._loop = loop
+            self._loop_thread = thread
+            atexit.register(self.close)
+        return self._loop
 
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            return asyncio.run(_runner())
-        if loop.is_running():  # pragma: no cover - defensive
-            raise RuntimeError(
-                "ElsevierExtractor.download cannot run inside an active event loop."
+    def _ensure_owned_client(
+        self,
+        elsevier_settings: ElsevierSettings,
+    ) -> ScienceDirectClient:
+        if self._owned_client is None:
+            future = asyncio.run_coroutine_threadsafe(
+                ScienceDirectClient(elsevier_settings).__aenter__(),
+                self._ensure_loop(),
             )
-        return loop.run_until_complete(_runner())
+            self._owned_client = future.result()
+        return self._owned_client
+
+    def close(self) -> None:
+        """Release the shared download client and its event loop."""
+        loop = self._loop
+        if loop is None:
+            return
+        if self._owned_client is not None:
+            with contextlib.suppress(Exception):
+                asyncio.run_coroutine_threadsafe(
+                    self._owned_client.__aexit__(None, None, None),
+                    loop,
+                ).result(timeout=10)
+            self._owned_client = None
+        loop.call_soon_threadsafe(loop.stop)
+        if self._loop_thread is not None:
+            self._loop_thread.join(timeout=5)
+            self._loop_thread = None
+        loop.close()
+        self._loop = None
 
     def _build_elsevier_settings(self) -> ElsevierSettings:
+        # The inputs come from self.settings, which never changes for the
+        # lifetime of the extractor, so build the Elsevier settings once.
+        if self._elsevier_settings is not None:
+            return self._elsevier_settings
+
         overrides: Dict[str, str] = {}
         if self.settings.elsevier_api_key:
             overrides["ELSEVIER_API_KEY"] = self.settings.elsevier_api_key
@@ -299,10 +422,11 @@ class ElsevierExtractor(BaseExtractor):
         if self.settings.elsevier_https_proxy:
             overrides["ELSEVIER_HTTPS_PROXY"] = self.settings.elsevier_https_proxy
         overrides["ELSEVIER_USE_PROXY"] = "true" if self.settings.elsevier_use_proxy else "false"
-        overrides["ELSEVIER_CONCURRENCY"] = str(max(1, self.settings.max_workers))
+        overrides["ELSEVIER_CONCURRENCY"] = str(self.settings.resolved_max_workers)
 
         with _temporary_env(overrides):
-            return get_elsevier_settings(force_reload=True)
+            self._elsevier_settings = get_elsevier_settings(force_reload=True)
+        return self._elsevier_settings
 
     def _build_download_result(
         self,
@@ -312,12 +436,11 @@ class ElsevierExtractor(BaseExtractor):
         identifier: Identifier,
         record: Mapping[str, str],
         article: Any | None,
+        metadata: Dict[str, Any] | None,
         index: int,
         lookup_type: str,
         lookup_value: str,
     ) -> DownloadResult:
-        slug = self._slug_from_record(record, index)
-
         if article is None:
             return DownloadResult(
                 identifier=identifier,
@@ -356,6 +479,10 @@ class ElsevierExtractor(BaseExtractor):
                 ),
             )
 
+        # Only computed on the persistence path; the failure returns above
+        # never use the slug.
+        slug = self._slug_from_record(record, index)
+
         try:
             files, has_payload = self._persist_article(
                 base_dir=base_dir,
@@ -364,6 +491,7 @@ class ElsevierExtractor(BaseExtractor):
                 slug=slug,
                 record=record,
                 article=article,
+                metadata=metadata,
                 lookup_type=lookup_type,
                 lookup_value=lookup_value,
             )
@@ -400,11 +528,12 @@ class ElsevierExtractor(BaseExtractor):
         slug: str,
         record: Mapping[str, str],
         article: Any,
+        metadata: Dict[str, Any] | None = None,
         lookup_type: str,
         lookup_value: str,
     ) -> Tuple[List[DownloadedFile], bool]:
-        article_dir = base_dir / cache_key
-        article_dir.mkdir(parents=True, exist_ok=True)
+        article_dir = self._article_dir(base_dir, cache_key)
+        self._ensure_dir(article_dir)
 
         payload = self._extract_payload(article)
         content_type = self._extract_content_type(article)
@@ -418,17 +547,20 @@ class ElsevierExtractor(BaseExtractor):
         has_payload = bool(payload)
         if has_payload:
             payload_path = article_dir / f"content.{extension}"
-            payload_path.write_bytes(payload)
+            if not self._payload_current(payload_path, payload):
+                _write_bytes(payload_path, payload)
             files.append(
                 build_downloaded_file(
                     payload_path,
                     file_type,
                     source=DownloadSource.ELSEVIER,
                     content_type=content_type,
+                    payload=payload,
                 )
             )
 
-        metadata = self._extract_metadata(article)
+        if metadata is None:
+            metadata = self._extract_metadata(article)
         metadata.setdefault("requested_record", dict(record))
         metadata.setdefault("slug", slug)
         metadata.setdefault("lookup_type", lookup_type)
@@ -438,27 +570,37 @@ class ElsevierExtractor(BaseExtractor):
             metadata["doi"] = self._extract_doi(article)
 
         metadata_path = article_dir / "metadata.json"
-        metadata_path.write_text(
-            json.dumps(metadata, indent=2, default=str),
-            encoding="utf-8",
-        )
+        metadata_bytes = json.dumps(metadata, indent=2, default=str).encode("utf-8")
+        if not self._payload_current(metadata_path, metadata_bytes):
+            _write_bytes(metadata_path, metadata_bytes)
         files.append(
             build_downloaded_file(
                 metadata_path,
                 FileType.JSON,
                 source=DownloadSource.ELSEVIER,
                 content_type="application/json",
+                payload=metadata_bytes,
             )
         )
 
         return files, has_payload
 
+    @staticmethod
+    def _payload_current(path: Path, payload: bytes) -> bool:
+        """Return True when ``path`` already holds exactly ``payload``."""
+        try:
+            if path.stat().st_size != len(payload):
+                return False
+            return path.read_bytes() == payload
+        except OSError:
+            return False
+
     @staticmethod
     def _slug_from_record(record: Mapping[str, str], index: int) -> str:
         candidate = record.get("doi") or record.get("pmid") or record.get("pmcid")
         if not candidate:
             candidate = f"record-{index}"
-        slug = re.sub(r"[^A-Za-z0-9]+", "-", candidate).strip("-").lower()
+        slug = _SLUG_RE.sub("-", candidate).strip("-").lower()
         return slug or f"record-{index}"
 
     def _infer_file_details(
@@ -521,6 +663,18 @@ class ElsevierExtractor(BaseExtractor):
             error_message=error_message,
         )
 
+    @staticmethod
+    def _article_dir(base_dir: Path, cache_key: str) -> Path:
+        # Two-level fanout keeps per-directory entry counts bounded as the
+        # cache grows; entries written before sharding stay readable in place.
+        sharded = base_dir / cache_key[:2] / cache_key[2:4] / cache_key
+        if sharded.exists():
+            return sharded
+        legacy = base_dir / cache_key
+        if legacy.exists():
+            return legacy
+        return sharded
+
     def _identifier_cache_key(self, identifier: Identifier, index: int) -> str:
         seed = identifier.slug.strip()
         if not seed:
@@ -625,7 +779,7 @@ def _extract_elsevier_article(
         raise ValueError("Elsevier extraction requires metadata.json.")
 
     try:
-        metadata = json.loads(metadata_file.file_path.read_text(encoding="utf-8"))
+        metadata = json.loads(metadata_file.file_path.read_bytes())
     except (json.JSONDecodeError, OSError) as exc:
         raise ValueError(f"Failed to load Elsevier metadata: {exc}") from exc
 
@@ -649,6 +803,21 @@ def _extract_elsevier_article(
         metadata=metadata,
     )
 
+    # Parse the payload once; the resulting text feeds both the fallback
+    # full-text file and coordinate-space detection below.
+    try:
+        tree = etree.fromstring(payload, _XML_PARSER)
+        # itertext() streams text nodes straight into the join instead of
+        # materializing the full node list the .//text() XPath builds.
+        article_text = " ".join(tree.itertext())
+    except Exception as exc:
+        logger.warning(
+            "Failed to parse article XML for %s: %s",
+            slug,
+            exc,
+        )
+        article_text = ""
+
     # Extract and save article text
     try:
         full_text_path = save_article_text(
@@ -662,27 +831,10 @@ def _extract_elsevier_article(
             slug,
             exc,
         )
-        # Create a fallback text file
-        output_dir.mkdir(parents=True, exist_ok=True)
+        # Create a fallback text file (output_dir already exists: it is the
+        # parent of tables_output_dir created above).
         full_text_path = output_dir / "article.txt"
-        try:
-            tree = etree.fromstring(payload)
-            text = " ".join(tree.xpath(".//text()"))
-            full_text_path.write_text(text, encoding="utf-8")
-        except Exception:  # pragma: no cover
-            full_text_path.write_text("", encoding="utf-8")
-
-    # Extract article text for space detection
-    try:
-        tree = etree.fromstring(payload)
-        article_text = " ".join(tree.xpath(".//text()"))
-    except Exception as exc:
-        logger.warning(
-            "Failed to parse article XML for %s: %s",
-            slug,
-            exc,
-        )
-        article_text = ""
+        full_text_path.write_text(article_text, encoding="utf-8")
 
     # Detect coordinate space from article text
     article_space = coordinate_space_from_guess(_neurosynth_guess_space(article_text))
@@ -726,12 +878,9 @@ def _extract_elsevier_article(
         # Write raw table XML
         raw_table_path = tables_output_dir / f"{sanitized_id}.xml"
         if table_metadata.raw_xml:
-            raw_table_path.write_text(
-                table_metadata.raw_xml,
-                encoding="utf-8",
-            )
+            _write_bytes(raw_table_path, table_metadata.raw_xml.encode("utf-8"))
         else:
-            raw_table_path.write_text("<table/>", encoding="utf-8")
+            _write_bytes(raw_table_path, b"<table/>")
 
         # Extract coordinates
         try:
@@ -747,33 +896,39 @@ def _extract_elsevier_article(
         coordinate_csv_path = tables_output_dir.joinpath(f"{sanitized_id}_coordinates.csv")
         if coordinates_frame is not None:
             coordinates_frame.to_csv(coordinate_csv_path, index=False)
-            if not coordinates_frame.empty:
-                for _, row in coordinates_frame.iterrows():
-                    coord = coordinate_from_row(row, article_space)
+            if not coordinates_frame.empty and {"x", "y", "z"}.issubset(
+                coordinates_frame.columns
+            ):
+                # Zip the three columns directly instead of iterrows(), which
+                # materializes a Series object per row.
+                for x_val, y_val, z_val in zip(
+                    coordinates_frame["x"],
+                    coordinates_frame["y"],
+                    coordinates_frame["z"],
+                ):
+                    coord = coordinate_from_row(
+                        {"x": x_val, "y": y_val, "z": z_val},
+                        article_space,
+                    )
                     if coord is not None:
                         coordinates.append(coord)
         else:
             # Write header-only CSV
-            coordinate_csv_path.write_text("x,y,z\n", encoding="utf-8")
-
-        # Record sources
-        table_sources[sanitized_id] = {
-            "table_label": table_metadata.label or "",
-            "table_id": table_metadata.identifier or "",
-            "raw_xml_path": str(raw_table_path),
-            "coordinates_path": str(coordinate_csv_path),
-        }
+            _write_bytes(coordinate_csv_path, b"x,y,z\n")
 
-        # Parse table number
-        table_number = parse_table_number(table_metadata.label)
-
-        # Build metadata dict
+        # One info dict serves both the manifest entry and the table metadata.
         extraction_metadata = {
             "table_id": table_metadata.identifier,
             "table_label": table_metadata.label,
             "raw_xml_path": str(raw_table_path),
             "coordinates_path": str(coordinate_csv_path),
         }
+        table_sources[sanitized_id] = {
+            key: value or "" for key, value in extraction_metadata.items()
+        }
+
+        # Parse table number
+        table_number = parse_table_number(table_metadata.label)
 
         extracted_tables.append(
             ExtractedTable(
@@ -803,10 +958,7 @@ def _extract_elsevier_article(
 
     # Write manifest
     sources_path = tables_output_dir / "table_sources.json"
-    sources_path.write_text(
-        json.dumps(table_sources, indent=2, sort_keys=True),
-        encoding="utf-8",
-    )
+    _dump_json(sources_path, table_sources, sort_keys=True)
 
     # Build result
     error_message = None
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from lxml import etree
 
@@ -15,7 +19,7 @@ from pubget._coordinate_space import _neurosynth_guess_space
 from pubget._download import download_pmcids
 from pubget._typing import ExitCode
 from pubget._utils import (
-    get_pmcid_from_article_dir,
+    article_bucket_from_pmcid,
     get_table_info_files_from_article_dir,
     load_stylesheet,
     read_article_table,
@@ -45,11 +49,124 @@ from ingestion_workflow.models import (
     Identifier,
     Identifiers,
 )
+from ingestion_workflow.utils.progress import emit_progress
 
 
 logger = logging.getLogger(__name__)
 
 
+ARTICLE_INDEX_FILENAME = "article_index.db"
+
+# Shared by every failure result; failures never carry files, so there is no
+# need to allocate a fresh empty list per identifier.
+_EMPTY_FILES: Tuple[DownloadedFile, ...] = ()
+
+
+@functools.lru_cache(maxsize=65536)
+def _normalize_pmcid(pmcid: Optional[str]) -> Optional[str]:
+    """Normalize a PMCID to its canonical digits-only form.
+
+    Pure and string-keyed, so it is memoized: the same PMCIDs recur across
+    batches, reruns, and retry flows.
+    """
+    if not pmcid:
+        return None
+    value = pmcid.strip()
+    if value[:3].upper() == "PMC":
+        value = value[3:].strip()
+    if not value.isdigit():
+        return None
+    # Remove leading zeros for consistent lookups without the
+    # int()/str() round-trip, which parses the digits twice.
+    return value.lstrip("0") or "0"
+
+
+class _PubgetStageError(RuntimeError):
+    """Raised when a Pubget download or extraction stage fails.
+
+    The message is user-facing and is recorded on the failed results.
+    """
+
+
+def _combine_exit_codes(codes: Sequence[ExitCode]) -> ExitCode:
+    if ExitCode.ERROR in codes:
+        return ExitCode.ERROR
+    if ExitCode.INCOMPLETE in codes:
+        return ExitCode.INCOMPLETE
+    return ExitCode.COMPLETED
+
+
+class _ArticleIndexCache:
+    """SQLite index of extracted article directories keyed by PMCID.
+
+    Pubget writes each download batch into its own pmcidList_* tree, so a
+    fresh walk of the current batch's articles directory cannot see articles
+    extracted by earlier runs. Persisting the PMCID -> article-directory
+    mapping lets later runs reuse those directories without re-walking the
+    whole cache. Entries are validated against the directory mtime recorded
+    at store time.
+    """
+
+    # Stay well below SQLite's default bound-parameter limit per statement.
+    _SELECT_CHUNK = 500
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # The extractor is memoized across run_downloads calls, and each run
+        # may drive Pubget from a different worker thread. Access is still
+        # serialized (one download call per extractor at a time), so sharing
+        # the connection across threads is safe.
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL;")
+        self._conn.execute("PRAGMA synchronous=NORMAL;")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            "pmcid TEXT PRIMARY KEY, "
+            "article_dir TEXT, "
+            "mtime_ns INTEGER)"
+        )
+        self._conn.commit()
+
+    def get_dirs(self, pmcids: Sequence[str]) -> Dict[str, Path]:
+        """Return still-valid cached article directories for ``pmcids``."""
+        hits: Dict[str, Path] = {}
+        for start in range(0, len(pmcids), self._SELECT_CHUNK):
+            chunk = pmcids[start : start + self._SELECT_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                "SELECT pmcid, article_dir, mtime_ns FROM articles "
+                f"WHERE pmcid IN ({placeholders})",
+                list(chunk),
+            )
+            for pmcid, article_dir, mtime_ns in rows:
+                path = Path(article_dir)
+                try:
+                    if path.stat().st_mtime_ns != mtime_ns:
+                        continue
+                except OSError:
+                    continue
+                hits[pmcid] = path
+        return hits
+
+    def store_dirs(self, index: Dict[str, Path]) -> None:
+        """Persist article directories along with their current mtime."""
+        entries = []
+        for pmcid, article_dir in index.items():
+            try:
+                mtime_ns = article_dir.stat().st_mtime_ns
+            except OSError:  # pragma: no cover - directory vanished
+                continue
+            entries.append((pmcid, str(article_dir), mtime_ns))
+        if not entries:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO articles (pmcid, article_dir, mtime_ns) "
+            "VALUES (?, ?, ?)",
+            entries,
+        )
+        self._conn.commit()
+
+
 class PubgetExtractor(BaseExtractor):
     """Extractor that uses Pubget for article and table downloads."""
 
@@ -59,6 +176,7 @@ class PubgetExtractor(BaseExtractor):
         self.settings = settings or load_settings()
         self.settings.ensure_directories()
         self._extraction_root = self._resolve_extraction_root()
+        self._index_cache: Optional[_ArticleIndexCache] = None
 
     def download(
         self,
@@ -69,102 +187,108 @@ class PubgetExtractor(BaseExtractor):
         if not identifiers:
             return []
 
+        ids = identifiers.identifiers
         pmcid_map: Dict[str, List[int]] = {}
-        results_by_index: Dict[int, DownloadResult] = {}
-
-        for index, identifier in enumerate(identifiers.identifiers):
-            normalized = self._normalize_pmcid(identifier.pmcid)
-            assert normalized is not None, "Identifiers must include PMCIDs"
-            pmcid_map.setdefault(normalized, []).append(index)
+        # Preallocated slot per identifier; index assignment avoids the dict
+        # hashing of the previous index -> result mapping.
+        results: List[Optional[DownloadResult]] = [None] * len(ids)
+
+        pmcids_to_fetch: List[int] = []
+        for index, pmcid in enumerate(identifiers.pmcid_column()):
+            normalized = _normalize_pmcid(pmcid)
+            if normalized is None:
+                results[index] = self._build_failure(
+                    ids[index],
+                    "Identifier does not include a usable PMCID.",
+                )
+                continue
+            indices = pmcid_map.setdefault(normalized, [])
+            if not indices:
+                pmcids_to_fetch.append(int(normalized))
+            indices.append(index)
 
         if not pmcid_map:
-            failure_message = "No valid PMCIDs were provided for Pubget download."
-            return self._ordered_results(
+            return self._fail_all(
                 identifiers,
-                results_by_index,
-                lambda identifier, msg=failure_message: self._build_failure(identifier, msg),
+                results,
+                "No valid PMCIDs were provided for Pubget download.",
             )
 
         data_dir = self._resolve_data_dir()
-        pmcids_to_fetch = [int(pmcid) for pmcid in sorted(pmcid_map)]
 
-        try:
-            articlesets_dir, download_code = download_pmcids(
-                pmcids_to_fetch,
-                data_dir=data_dir,
-                api_key=self.settings.pubmed_api_key,
-                retmax=self.settings.pubmed_batch_size,
-            )
-        except Exception as exc:  # pragma: no cover - surfaced to caller
-            failure_message = f"Pubget download failed: {exc}"
-            for indices in pmcid_map.values():
-                for idx in indices:
-                    identifier = identifiers.identifiers[idx]
-                    results_by_index[idx] = self._build_failure(
-                        identifier,
-                        failure_message,
-                    )
-            return self._ordered_results(
+        # Serve PMCIDs already extracted by earlier runs straight from the
+        # persistent index and only hand the misses to Pubget. When every
+        # PMCID is covered, the download and extraction calls are skipped
+        # entirely.
+        index_cache = self._article_index_cache()
+        cached_dirs = index_cache.get_dirs(list(pmcid_map))
+        if cached_dirs:
+            pmcids_to_fetch = [
+                pmcid for pmcid in pmcids_to_fetch if str(pmcid) not in cached_dirs
+            ]
+
+        if not pmcids_to_fetch:
+            articles_dirs: List[Path] = []
+            download_code = ExitCode.COMPLETED
+            extract_code = ExitCode.COMPLETED
+            return self._finalize_download(
                 identifiers,
-                results_by_index,
-                lambda identifier, msg=failure_message: self._build_failure(identifier, msg),
-                progress_hook=progress_hook,
+                results,
+                pmcid_map,
+                cached_dirs,
+                articles_dirs,
+                download_code,
+                extract_code,
+                progress_hook,
             )
 
-        if download_code == ExitCode.ERROR:
-            failure_message = "Pubget reported an error while downloading PMCIDs."
-            for indices in pmcid_map.values():
-                for idx in indices:
-                    identifier = identifiers.identifiers[idx]
-                    results_by_index[idx] = self._build_failure(
-                        identifier,
-                        failure_message,
-                    )
-            return self._ordered_results(
-                identifiers,
-                results_by_index,
-                lambda identifier, msg=failure_message: self._build_failure(identifier, msg),
-                progress_hook=progress_hook,
-            )
-
-        n_jobs = max(1, self.settings.max_workers)
         try:
-            articles_dir, extract_code = extract_articles(
-                articlesets_dir,
-                n_jobs=n_jobs,
+            articles_dirs, download_code, extract_code = self._download_and_extract(
+                pmcids_to_fetch,
+                data_dir,
             )
-        except Exception as exc:  # pragma: no cover - surfaced to caller
-            failure_message = f"Pubget extraction failed: {exc}"
-            for indices in pmcid_map.values():
-                for idx in indices:
-                    identifier = identifiers.identifiers[idx]
-                    results_by_index[idx] = self._build_failure(
-                        identifier,
-                        failure_message,
-                    )
-            return self._ordered_results(
+        except _PubgetStageError as exc:  # pragma: no cover - surfaced to caller
+            return self._fail_all(identifiers, results, str(exc), progress_hook)
+
+        if download_code == ExitCode.ERROR:
+            return self._fail_all(
                 identifiers,
-                results_by_index,
-                lambda identifier, msg=failure_message: self._build_failure(identifier, msg),
-                progress_hook=progress_hook,
+                results,
+                "Pubget reported an error while downloading PMCIDs.",
+                progress_hook,
             )
 
         if extract_code == ExitCode.ERROR:
-            failure_message = "Pubget failed to extract downloaded articles."
-            for indices in pmcid_map.values():
-                for idx in indices:
-                    identifier = identifiers.identifiers[idx]
-                    results_by_index[idx] = self._build_failure(
-                        identifier,
-                        failure_message,
-                    )
-            return self._ordered_results(
+            return self._fail_all(
                 identifiers,
-                results_by_index,
-                lambda identifier, msg=failure_message: self._build_failure(identifier, msg),
-                progress_hook=progress_hook,
+                results,
+                "Pubget failed to extract downloaded articles.",
+                progress_hook,
             )
 
+        return self._finalize_download(
+            identifiers,
+            results,
+            pmcid_map,
+            cached_dirs,
+            articles_dirs,
+            download_code,
+            extract_code,
+            progress_hook,
+        )
+
+    def _finalize_download(
+        self,
+        identifiers: Identifiers,
+        results: List[Optional[DownloadResult]],
+        pmcid_map: Dict[str, List[int]],
+        cached_dirs: Dict[str, Path],
+        articles_dirs: List[Path],
+        download_code: ExitCode,
+        extract_code: ExitCode,
+        progress_hook: Callable[[int], None] | None,
+    ) -> list[DownloadResult]:
+        """Resolve article directories and build per-identifier results."""
         warning_messages: List[str] = []
         if download_code == ExitCode.INCOMPLETE:
             warning_messages.append(
@@ -176,30 +300,69 @@ class PubgetExtractor(BaseExtractor):
             )
         combined_warning = " ".join(warning_messages) if warning_messages else None
 
-        article_index = self._index_articles(articles_dir)
+        resolved_dirs: Dict[str, Path] = dict(cached_dirs)
+        pending_pmcids = [pmcid for pmcid in pmcid_map if pmcid not in resolved_dirs]
+        needed_buckets = {
+            article_bucket_from_pmcid(int(pmcid)) for pmcid in pending_pmcids
+        }
+        bucket_index: Dict[str, Dict[str, Path]] = {}
+        for articles_dir in articles_dirs:
+            for bucket_name, shard in self._index_articles(
+                articles_dir, needed_buckets
+            ).items():
+                bucket_index.setdefault(bucket_name, {}).update(shard)
+        for pmcid in pending_pmcids:
+            bucket = bucket_index.get(article_bucket_from_pmcid(int(pmcid)))
+            article_dir = bucket.get(pmcid) if bucket else None
+            if article_dir is not None:
+                resolved_dirs[pmcid] = article_dir
+        self._article_index_cache().store_dirs(resolved_dirs)
+
+        ids = identifiers.identifiers
+        success_tasks: List[tuple[int, Identifier, Path]] = []
         for pmcid, indices in pmcid_map.items():
-            article_dir = article_index.get(pmcid)
+            article_dir = resolved_dirs.get(pmcid)
             for idx in indices:
-                identifier = identifiers.identifiers[idx]
+                identifier = ids[idx]
                 if article_dir is None:
                     message = combined_warning or (
                         "Pubget did not produce output for the requested PMCID."
                     )
-                    results_by_index[idx] = self._build_failure(
+                    results[idx] = self._build_failure(
                         identifier,
                         message,
                     )
                     continue
-                results_by_index[idx] = self._build_success(
+                success_tasks.append((idx, identifier, article_dir))
+
+        worker_count = self.settings.resolved_max_workers
+        if worker_count == 1 or len(success_tasks) <= 1:
+            for idx, identifier, article_dir in success_tasks:
+                results[idx] = self._build_success(
                     identifier,
                     article_dir,
                     combined_warning,
                 )
+        else:
+            # Hashing releases the GIL and the file scans are I/O bound, so
+            # threads let per-article work overlap.
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                future_map = {
+                    executor.submit(
+                        self._build_success,
+                        identifier,
+                        article_dir,
+                        combined_warning,
+                    ): idx
+                    for idx, identifier, article_dir in success_tasks
+                }
+                for future in as_completed(future_map):
+                    results[future_map[future]] = future.result()
 
         default_message = "Pubget did not return content for this identifier."
         return self._ordered_results(
             identifiers,
-            results_by_index,
+            results,
             lambda identifier, msg=default_message: self._build_failure(identifier, msg),
             progress_hook=progress_hook,
         )
@@ -214,7 +377,7 @@ class PubgetExtractor(BaseExtractor):
             download_results,
             extraction_root=self._extraction_root,
             worker=_run_pubget_extraction_task,
-            worker_count=self.settings.max_workers,
+            worker_count=self.settings.resolved_max_workers,
             source_name="Pubget",
             failure_message="Pubget extraction did not produce a result.",
             failure_builder=lambda download_result, message: build_failure_extraction(
@@ -237,31 +400,117 @@ class PubgetExtractor(BaseExtractor):
             return self.settings.pubget_cache_root
         return self.settings.get_cache_dir("pubget")
 
+    def _download_and_extract(
+        self,
+        pmcids_to_fetch: List[int],
+        data_dir: Path,
+    ) -> tuple[List[Path], ExitCode, ExitCode]:
+        """Run Pubget download and extraction, overlapping them when possible.
+
+        Downloads stay serial because NCBI rate limits apply regardless, but
+        for batches spanning multiple download chunks each chunk's extraction
+        is started as soon as its articlesets land, so XML parsing overlaps
+        the next chunk's network transfer.
+        """
+        chunk_size = max(1, self.settings.pubmed_batch_size)
+        # No point spawning more extraction jobs than there are articles.
+        n_jobs = min(self.settings.resolved_max_workers, max(1, len(pmcids_to_fetch)))
+        chunks = [
+            pmcids_to_fetch[start : start + chunk_size]
+            for start in range(0, len(pmcids_to_fetch), chunk_size)
+        ]
+
+        def run_download(chunk: List[int]) -> tuple[Path, ExitCode]:
+            try:
+                return download_pmcids(
+                    chunk,
+                    data_dir=data_dir,
+                    api_key=self.settings.pubmed_api_key,
+                    retmax=self.settings.pubmed_batch_size,
+                )
+            except Exception as exc:  # pragma: no cover - surfaced to caller
+                raise _PubgetStageError(f"Pubget download failed: {exc}") from exc
+
+        def run_extract(articlesets_dir: Path) -> tuple[Path, ExitCode]:
+            try:
+                return extract_articles(articlesets_dir, n_jobs=n_jobs)
+            except Exception as exc:  # pragma: no cover - surfaced to caller
+                raise _PubgetStageError(f"Pubget extraction failed: {exc}") from exc
+
+        download_codes: List[ExitCode] = []
+        extract_codes: List[ExitCode] = []
+        articles_dirs: List[Path] = []
+
+        if len(chunks) == 1:
+            articlesets_dir, download_code = run_download(chunks[0])
+            download_codes.append(download_code)
+            if download_code != ExitCode.ERROR:
+                articles_dir, extract_code = run_extract(articlesets_dir)
+                extract_codes.append(extract_code)
+                articles_dirs.append(articles_dir)
+        else:
+            # extract_articles parallelizes internally via n_jobs, so one
+            # pipeline thread is enough to keep it off the download path.
+            with ThreadPoolExecutor(max_workers=1) as extraction_pool:
+                pending = []
+                for chunk in chunks:
+                    articlesets_dir, download_code = run_download(chunk)
+                    download_codes.append(download_code)
+                    if download_code == ExitCode.ERROR:
+                        break
+                    pending.append(extraction_pool.submit(run_extract, articlesets_dir))
+                for future in pending:
+                    articles_dir, extract_code = future.result()
+                    extract_codes.append(extract_code)
+                    articles_dirs.append(articles_dir)
+
+        return (
+            articles_dirs,
+            _combine_exit_codes(download_codes),
+            _combine_exit_codes(extract_codes),
+        )
+
+    def _article_index_cache(self) -> _ArticleIndexCache:
+        if self._index_cache is None:
+            self._index_cache = _ArticleIndexCache(
+                self._resolve_data_dir() / ARTICLE_INDEX_FILENAME
+            )
+        return self._index_cache
+
     def _normalize_pmcid(self, pmcid: str | None) -> str | None:
-        if not pmcid:
-            return None
-        value = pmcid.strip().upper()
-        if value.startswith("PMC"):
-            value = value[3:]
-        value = value.strip()
-        if not value.isdigit():
-            return None
-        # Remove leading zeros for consistent lookups.
-        return str(int(value))
-
-    def _index_articles(self, articles_dir: Path) -> Dict[str, Path]:
-        index: Dict[str, Path] = {}
-        if not articles_dir.exists():
+        return _normalize_pmcid(pmcid)
+
+    def _index_articles(
+        self,
+        articles_dir: Path,
+        needed_buckets: set[str] | None = None,
+    ) -> Dict[str, Dict[str, Path]]:
+        # Index sharded by Pubget bucket name; lookups go through
+        # article_bucket_from_pmcid, which is how Pubget places articles.
+        # When ``needed_buckets`` is given, buckets no requested PMCID can
+        # live in are skipped entirely.
+        index: Dict[str, Dict[str, Path]] = {}
+        try:
+            buckets = os.scandir(articles_dir)
+        except OSError:
             return index
-        for bucket in articles_dir.iterdir():
-            if not bucket.is_dir():
-                continue
-            for article_dir in bucket.glob("pmcid_*"):
-                try:
-                    pmcid_value = str(get_pmcid_from_article_dir(article_dir))
-                except Exception:  # pragma: no cover - defensive guard
+        # scandir's DirEntry caches the directory type from the listing, so
+        # no extra stat() is issued per child, and the PMCID is read straight
+        # from the "pmcid_<id>" directory name.
+        with buckets:
+            for bucket in buckets:
+                if needed_buckets is not None and bucket.name not in needed_buckets:
                     continue
-                index[pmcid_value] = article_dir
+                if not bucket.is_dir(follow_symlinks=False):
+                    continue
+                shard = index.setdefault(bucket.name, {})
+                with os.scandir(bucket.path) as article_entries:
+                    for entry in article_entries:
+                        if not entry.name.startswith("pmcid_"):
+                            continue
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        shard[entry.name[len("pmcid_"):]] = Path(entry.path)
         return index
 
     def _build_success(
@@ -274,31 +523,40 @@ class PubgetExtractor(BaseExtractor):
         missing: List[str] = []
         seen_paths: set[Path] = set()
 
+        # Each expected file is opened once: the read supplies both the
+        # existence check and the hash payload, instead of a stat() probe
+        # followed by a second open inside the hasher.
         article_xml = article_dir.joinpath("article.xml")
-        if article_xml.is_file():
+        try:
+            payload = article_xml.read_bytes()
+        except OSError:
+            missing.append("article.xml")
+        else:
             files.append(
                 build_downloaded_file(
                     article_xml,
                     FileType.XML,
                     source=DownloadSource.PUBGET,
+                    payload=payload,
                 )
             )
             seen_paths.add(article_xml)
-        else:
-            missing.append("article.xml")
 
         tables_xml = article_dir.joinpath("tables", "tables.xml")
-        if tables_xml.is_file():
+        try:
+            payload = tables_xml.read_bytes()
+        except OSError:
+            missing.append("tables/tables.xml")
+        else:
             files.append(
                 build_downloaded_file(
                     tables_xml,
                     FileType.XML,
                     source=DownloadSource.PUBGET,
+                    payload=payload,
                 )
             )
             seen_paths.add(tables_xml)
-        else:
-            missing.append("tables/tables.xml")
 
         tables_dir = article_dir.joinpath("tables")
         if tables_dir.is_dir():
@@ -306,7 +564,9 @@ class PubgetExtractor(BaseExtractor):
             for info_path in info_paths:
                 if info_path in seen_paths:
                     continue
-                if not info_path.is_file():
+                try:
+                    info_payload = info_path.read_bytes()
+                except OSError:
                     missing.append(str(info_path.relative_to(article_dir)))
                     continue
                 files.append(
@@ -314,11 +574,12 @@ class PubgetExtractor(BaseExtractor):
                         info_path,
                         FileType.JSON,
                         source=DownloadSource.PUBGET,
+                        payload=info_payload,
                     )
                 )
                 seen_paths.add(info_path)
                 try:
-                    table_info = json.loads(info_path.read_text(encoding="utf-8"))
+                    table_info = json.loads(info_payload)
                 except json.JSONDecodeError:
                     missing.append(f"Invalid JSON: {info_path.name}")
                     continue
@@ -327,16 +588,19 @@ class PubgetExtractor(BaseExtractor):
                     missing.append(f"Missing table_data_file in {info_path.name}")
                     continue
                 data_path = info_path.with_name(str(data_name))
-                if not data_path.is_file():
-                    missing.append(str(data_path.relative_to(article_dir)))
-                    continue
                 if data_path in seen_paths:
                     continue
+                try:
+                    data_payload = data_path.read_bytes()
+                except OSError:
+                    missing.append(str(data_path.relative_to(article_dir)))
+                    continue
                 files.append(
                     build_downloaded_file(
                         data_path,
                         FileType.CSV,
                         source=DownloadSource.PUBGET,
+                        payload=data_payload,
                     )
                 )
                 seen_paths.add(data_path)
@@ -362,12 +626,29 @@ class PubgetExtractor(BaseExtractor):
             error_message=error_message,
         )
 
+    def _fail_all(
+        self,
+        identifiers: Identifiers,
+        results: List[Optional[DownloadResult]],
+        message: str,
+        progress_hook: Callable[[int], None] | None = None,
+    ) -> list[DownloadResult]:
+        """Fill every unresolved result slot with the same failure message."""
+        ids = identifiers.identifiers
+        ordered = [
+            result if result is not None else self._build_failure(ids[index], message)
+            for index, result in enumerate(results)
+        ]
+        for _ in ordered:
+            emit_progress(progress_hook)
+        return ordered
+
     def _build_failure(self, identifier: Identifier, message: str) -> DownloadResult:
         return DownloadResult(
             identifier=identifier,
             source=DownloadSource.PUBGET,
             success=False,
-            files=[],
+            files=_EMPTY_FILES,
             error_message=message,
         )
 
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import hashlib
 import math
+import mmap
+import os
 import re
 from pathlib import Path
 from typing import Any, Optional
@@ -29,16 +31,59 @@ DEFAULT_CONTENT_TYPES: dict[FileType, str] = {
 }
 
 
+# Files at or below this size are hashed from a single read; larger ones are
+# streamed so peak memory stays at one chunk regardless of file size.
+_STREAM_HASH_THRESHOLD = 64 * 1024
+_STREAM_HASH_CHUNK = 1 << 20
+
+
+def _hash_file(path: Path) -> str:
+    """Hash a file's contents without materializing them as one bytes object."""
+    hasher = hashlib.sha256()
+    with path.open("rb", buffering=0) as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size <= _STREAM_HASH_THRESHOLD:
+            hasher.update(handle.read())
+            return hasher.hexdigest()
+        try:
+            # Hash straight from the page cache; no userspace copy of the
+            # file contents is made.
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, "madvise"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                hasher.update(mapped)
+                return hasher.hexdigest()
+        except (ValueError, OSError):  # pragma: no cover - mmap unavailable
+            pass
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        buffer = bytearray(_STREAM_HASH_CHUNK)
+        view = memoryview(buffer)
+        while True:
+            read = handle.readinto(buffer)
+            if not read:
+                break
+            hasher.update(view[:read])
+    return hasher.hexdigest()
+
+
 def build_downloaded_file(
     path: Path,
     file_type: FileType,
     *,
     source: DownloadSource,
     content_type: str | None = None,
+    payload: bytes | None = None,
 ) -> DownloadedFile:
-    """Create a DownloadedFile entry with consistent hashing and content-type."""
-    payload = path.read_bytes()
-    md5_hash = hashlib.md5(payload).hexdigest()
+    """Create a DownloadedFile entry with consistent hashing and content-type.
+
+    Callers that still hold the written bytes can pass them as ``payload`` to
+    avoid reading the file back from disk for hashing.
+    """
+    if payload is None:
+        content_hash = _hash_file(path)
+    else:
+        content_hash = hashlib.sha256(payload).hexdigest()
     resolved_content_type = content_type or DEFAULT_CONTENT_TYPES.get(
         file_type,
         DEFAULT_CONTENT_TYPES[FileType.BINARY],
@@ -48,7 +93,7 @@ def build_downloaded_file(
         file_type=file_type,
         content_type=resolved_content_type,
         source=source,
-        md5_hash=md5_hash,
+        content_hash=content_hash,
     )
 
 
@@ -12,6 +12,7 @@ from typing import (
     ClassVar,
     Dict,
     Generic,
+    Iterable,
     Iterator,
     List,
     Mapping,
@@ -31,6 +32,9 @@ from .metadata import ArticleMetadata, Author
 
 CACHE_SCHEMA_VERSION = 1
 
+# Keep bulk SELECTs comfortably below SQLite's default host-parameter limit.
+_SELECT_CHUNK = 500
+
 
 PayloadT = TypeVar("PayloadT")
 EnvelopeT = TypeVar("EnvelopeT", bound="CacheEnvelope[Any]")
@@ -200,7 +204,7 @@ class CacheIndex(Generic[EnvelopeT]):
         columns.extend(self.extra_columns.keys())
         return columns
 
-    def add_entries(self, entries: Sequence[EnvelopeT]) -> None:
+    def add_entries(self, entries: Iterable[EnvelopeT]) -> None:
         if not entries:
             return
         column_names = self._column_names()
@@ -213,9 +217,10 @@ class CacheIndex(Generic[EnvelopeT]):
             f"VALUES ({placeholders}) "
             f"ON CONFLICT(slug) DO UPDATE SET {assignments}"
         )
-        rows = [self._row_from_entry(entry) for entry in entries]
+        # Rows stream straight into the single executemany transaction, so
+        # generator callers keep memory O(1) in the number of entries.
         with self._conn:
-            self._conn.executemany(sql, rows)
+            self._conn.executemany(sql, (self._row_from_entry(entry) for entry in entries))
 
     def add(self, entry: EnvelopeT) -> None:
         self.add_entries([entry])
@@ -245,6 +250,30 @@ class CacheIndex(Generic[EnvelopeT]):
             )
         return cursor.rowcount > 0
 
+    def get_many(self, slugs: Sequence[str]) -> Dict[str, EnvelopeT]:
+        """Fetch entries for many slugs in chunked bulk SELECTs.
+
+        Returns a mapping of slug to entry containing only the slugs that are
+        present in the index; absent slugs are simply omitted.
+        """
+        found: Dict[str, EnvelopeT] = {}
+        for start in range(0, len(slugs), _SELECT_CHUNK):
+            chunk = slugs[start : start + _SELECT_CHUNK]
+            placeholders = ", ".join("?" for _ in chunk)
+            cursor = self._conn.execute(
+                f"SELECT * FROM {self.table_name} WHERE slug IN ({placeholders})",
+                tuple(chunk),
+            )
+            for row in cursor:
+                entry = self._entry_from_row(row)
+                found[entry.cache_key()] = entry
+        return found
+
+    def slugs(self) -> set[str]:
+        """Return every cached slug for bulk membership tests."""
+        cursor = self._conn.execute(f"SELECT slug FROM {self.table_name}")
+        return {row["slug"] for row in cursor}
+
     def count(self) -> int:
         cursor = self._conn.execute(f"SELECT COUNT(*) FROM {self.table_name}")
         result = cursor.fetchone()
@@ -40,7 +40,10 @@ class DownloadedFile:
     content_type: str
     source: DownloadSource
     downloaded_at: datetime = field(default_factory=datetime.utcnow)
-    md5_hash: Optional[str] = None
+    # SHA-256 hex digest of the file contents, used only as a change-detection
+    # fingerprint. Entries persisted before the switch from MD5 are still
+    # accepted by ``from_dict``.
+    content_hash: Optional[str] = None
 
     def to_dict(self) -> Dict[str, object]:
         return {
@@ -49,7 +52,7 @@ class DownloadedFile:
             "content_type": self.content_type,
             "source": self.source.value,
             "downloaded_at": self.downloaded_at.isoformat(),
-            "md5_hash": self.md5_hash,
+            "content_hash": self.content_hash,
         }
 
     @classmethod
@@ -60,7 +63,7 @@ class DownloadedFile:
             content_type=str(payload["content_type"]),
             source=DownloadSource(str(payload["source"])),
             downloaded_at=datetime.fromisoformat(str(payload["downloaded_at"])),
-            md5_hash=payload.get("md5_hash") or None,
+            content_hash=payload.get("content_hash") or payload.get("md5_hash") or None,
         )
 
 
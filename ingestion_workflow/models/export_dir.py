@@ -78,7 +78,7 @@ class JsonFile:
     @classmethod
     def load(cls, root: Path, rel_path: Path) -> "JsonFile":
         path = root / rel_path
-        return cls(rel_path=rel_path, data=json.loads(path.read_text(encoding="utf-8")))
+        return cls(rel_path=rel_path, data=json.loads(path.read_bytes()))
 
 
 @dataclass
@@ -100,7 +100,7 @@ class JsonLinesFile:
     @classmethod
     def load(cls, root: Path, rel_path: Path) -> "JsonLinesFile":
         path = root / rel_path
-        lines = [line for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+        lines = [line for line in path.read_bytes().splitlines() if line.strip()]
         return cls(rel_path=rel_path, records=[json.loads(line) for line in lines])
 
 
@@ -139,7 +139,7 @@ def _download_entries(
             "file_type": file.file_type.value,
             "content_type": file.content_type,
             "downloaded_at": file.downloaded_at.isoformat(),
-            "md5_hash": file.md5_hash,
+            "content_hash": file.content_hash,
         }
         for file in entry.result.files
     ]
@@ -84,7 +84,9 @@ class Identifier(MutableMapping[str, Optional[str]]):
 
     # -- MutableMapping protocol ----------------------------------------------
 
-    _PRIMARY_KEYS = {"neurostore", "pmid", "doi", "pmcid"}
+    # frozenset for membership tests, tuple for deterministic iteration order.
+    _PRIMARY_KEYS = frozenset({"neurostore", "pmid", "doi", "pmcid"})
+    _PRIMARY_ORDER = ("neurostore", "pmid", "doi", "pmcid")
 
     def __getitem__(self, key: str) -> Optional[str]:
         normalized_key = self._normalize_mapping_key(key)
@@ -126,7 +128,7 @@ class Identifier(MutableMapping[str, Optional[str]]):
         raise KeyError(key)
 
     def __iter__(self) -> Iterator[str]:
-        for primary in self._PRIMARY_KEYS:
+        for primary in self._PRIMARY_ORDER:
             value = getattr(self, primary)
             if value is not None:
                 yield primary
@@ -135,7 +137,7 @@ class Identifier(MutableMapping[str, Optional[str]]):
                 yield key
 
     def __len__(self) -> int:
-        count = sum(1 for key in self._PRIMARY_KEYS if getattr(self, key) is not None)
+        count = sum(1 for key in self._PRIMARY_ORDER if getattr(self, key) is not None)
         if self.other_ids:
             count += len(self.other_ids)
         return count
@@ -328,6 +330,14 @@ class Identifiers:
 
         return cls(identifiers=identifiers)
 
+    def pmcid_column(self) -> list[Optional[str]]:
+        """Return the PMCIDs as one parallel column.
+
+        Batch passes that only need PMCIDs can iterate this list instead of
+        doing an attribute load on every Identifier.
+        """
+        return [identifier.pmcid for identifier in self.identifiers]
+
     # List-like interface methods
     def __len__(self) -> int:
         """Return the number of identifiers."""
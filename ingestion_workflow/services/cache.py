@@ -260,17 +260,20 @@ def cache_create_analyses_results(
     with _acquire_lock(settings, namespace, extractor_name):
         index_path = _index_path(settings, namespace, extractor_name)
         index = CreateAnalysesResultIndex.load(index_path)
-        entries_to_add: List[CreateAnalysesResultEntry] = []
-        for result in results:
-            manifest_path = _analysis_manifest_path(settings, extractor_name, result.slug)
-            manifest_path.write_text(
-                json.dumps(result.analysis_collection.to_dict(), indent=2),
-                encoding="utf-8",
-            )
-            result.analysis_paths = [manifest_path]
-            entry = CreateAnalysesResultEntry.from_result(result)
-            entries_to_add.append(entry)
-        index.add_entries(entries_to_add)
+
+        def _entries() -> Iterator[CreateAnalysesResultEntry]:
+            for result in results:
+                manifest_path = _analysis_manifest_path(settings, extractor_name, result.slug)
+                manifest_path.write_text(
+                    json.dumps(result.analysis_collection.to_dict(), indent=2),
+                    encoding="utf-8",
+                )
+                result.analysis_paths = [manifest_path]
+                yield CreateAnalysesResultEntry.from_result(result)
+
+        # Entries stream into the index's bulk insert instead of being
+        # materialized as an intermediate list first.
+        index.add_entries(_entries())
 
 
 def get_identifier_cache_entry(
@@ -329,11 +332,12 @@ def partition_cached_downloads(
     """
 
     index = load_download_index(settings, extractor_name, namespace=namespace)
+    entries = index.get_many([identifier.slug for identifier in identifiers.identifiers])
     cached_results: List[DownloadResult] = []
     missing: List[Identifier] = []
 
     for identifier in identifiers.identifiers:
-        entry = index.get_download(identifier.slug)
+        entry = entries.get(identifier.slug)
         if entry is None:
             missing.append(identifier)
             continue
@@ -705,11 +709,14 @@ def partition_cached_extractions(
     """Split download results into cached extractions and missing work."""
 
     index = load_extractor_index(settings, extractor_name, namespace=namespace)
+    entries = index.get_many(
+        [download_result.identifier.slug for download_result in download_results]
+    )
     cached_results: List[ExtractionResult | None] = []
     missing: List[DownloadResult] = []
 
     for download_result in download_results:
-        entry = index.get_extraction(download_result.identifier.slug)
+        entry = entries.get(download_result.identifier.slug)
         if entry is None:
             cached_results.append(None)
             missing.append(download_result)
@@ -6,7 +6,7 @@ import json
 import logging
 import re
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence
 
 from ingestion_workflow.clients import CoordinateParsingClient
 from ingestion_workflow.config import Settings
@@ -53,16 +53,25 @@ class CreateAnalysesService:
         self,
         bundle: ArticleExtractionBundle,
         progress_hook: Callable[[int], None] | None = None,
+        *,
+        tables: Sequence[ExtractedTable] | None = None,
     ) -> Dict[str, AnalysisCollection]:
-        """Create analyses for every table in the bundle."""
-        if not bundle.article_data.tables:
+        """Create analyses for every table in the bundle.
+
+        When ``tables`` is provided it is processed instead of the bundle's
+        own table list, so callers can restrict the run to a subset without
+        copying the article data into a pruned bundle.
+        """
+        if tables is None:
+            tables = bundle.article_data.tables
+        if not tables:
             return {}
 
         results: Dict[str, AnalysisCollection] = {}
         article_slug = bundle.article_data.slug
         identifier = bundle.article_data.identifier
 
-        for index, table in enumerate(bundle.article_data.tables):
+        for index, table in enumerate(tables):
             if not table.contains_coordinates and not table.coordinates:
                 logger.debug(
                     "Skipping table %s for article %s (no coordinates detected).",
@@ -263,6 +263,8 @@ class PubMedIDLookupService(IDLookupService):
                 email=self._email,
                 api_key=self._api_key or None,
                 tool=self._tool,
+                batch_size=settings.pubmed_batch_size,
+                cache_dir=settings.cache_root if settings.pubmed_idconv_cache else None,
             )
         else:
             self._client = None
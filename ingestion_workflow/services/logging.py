@@ -52,6 +52,12 @@ def configure_logging(
         fallback_handler.setFormatter(formatter)
         root_logger.addHandler(fallback_handler)
 
+    # httpx/httpcore log every request at INFO; raise them to WARNING once
+    # here instead of toggling logger levels around individual calls, which
+    # would race when downloads run concurrently.
+    for noisy_logger in ("httpx", "httpcore"):
+        logging.getLogger(noisy_logger).setLevel(logging.WARNING)
+
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Return a namespaced logger rooted under ``ingestion_workflow``."""
@@ -54,6 +54,8 @@ class MetadataService:
             self._pubmed_client = PubMedClient(
                 email=settings.pubmed_email,
                 api_key=settings.pubmed_api_key,
+                batch_size=settings.pubmed_batch_size,
+                cache_dir=settings.cache_root if settings.pubmed_idconv_cache else None,
             )
 
     def enrich_metadata(
@@ -173,7 +175,7 @@ class MetadataService:
             cache_file = cache_dir / f"{identifier.slug}.json"
             if cache_file.exists():
                 try:
-                    data = json.loads(cache_file.read_text(encoding="utf-8"))
+                    data = json.loads(cache_file.read_bytes())
                     results[identifier.slug] = ArticleMetadata.from_dict(data)
                 except Exception as exc:
                     logger.warning(
@@ -224,7 +226,7 @@ class MetadataService:
             cache_file = cache_dir / f"{identifier.slug}.json"
             if cache_file.exists():
                 try:
-                    data = json.loads(cache_file.read_text(encoding="utf-8"))
+                    data = json.loads(cache_file.read_bytes())
                     results[identifier.slug] = ArticleMetadata.from_dict(data)
                 except Exception as exc:
                     logger.warning(
@@ -346,7 +348,7 @@ class MetadataService:
             return None
 
         try:
-            data = json.loads(metadata_file.read_text(encoding="utf-8"))
+            data = json.loads(metadata_file.read_bytes())
 
             # Elsevier metadata structure varies, extract what we can
             title = None
@@ -46,4 +46,8 @@ class PubMedSearchService(ArticleSearchService):
             email=self.settings.pubmed_email,
             api_key=self.settings.pubmed_api_key or None,
             tool=self.settings.pubmed_tool or "ingestion-workflow",
+            batch_size=self.settings.pubmed_batch_size,
+            cache_dir=(
+                self.settings.cache_root if self.settings.pubmed_idconv_cache else None
+            ),
         )
@@ -77,4 +77,4 @@ def test_cli_create_analyses_writes_output(monkeypatch, tmp_path):
         catch_exceptions=False,
     )
     assert result.exit_code == 0
-    assert json.loads(output_path.read_text(encoding="utf-8")) == expected_serialized
+    assert json.loads(output_path.read_bytes()) == expected_serialized
@@ -1,6 +1,6 @@
 import pytest
 
-from ingestion_workflow.clients.pubmed import PubMedClient
+from ingestion_workflow.clients.pubmed import PubMedClient, _IdConvDiskCache
 from ingestion_workflow.models.ids import Identifier, Identifiers
 
 
@@ -23,3 +23,75 @@ def test_pubmed_client_enriches_from_doi(manifest_identifiers):
     assert enriched.pmid == original.pmid
     assert enriched.pmcid == original.pmcid
     assert enriched.doi == original.doi
+
+
+def test_idconv_disk_cache_round_trip(tmp_path):
+    cache = _IdConvDiskCache(tmp_path / "idconv_cache.db")
+    cache.store_records(
+        "doi",
+        [
+            {"requested-id": "10.1234/kept", "pmid": "111"},
+            {"requested-id": "10.1234/status-error", "status": "error"},
+            {"requested-id": "10.1234/error-field", "error": "not found"},
+            {"pmid": "222"},
+        ],
+    )
+
+    hits = cache.get_records(
+        [
+            "10.1234/kept",
+            "10.1234/status-error",
+            "10.1234/error-field",
+            "10.1234/never-stored",
+        ]
+    )
+
+    # Only the successful record is persisted; error records and records
+    # without a requested-id are excluded at store time.
+    assert hits == {"10.1234/kept": {"requested-id": "10.1234/kept", "pmid": "111"}}
+
+
+def test_idconv_disk_cache_chunks_large_lookups(tmp_path):
+    cache = _IdConvDiskCache(tmp_path / "idconv_cache.db")
+    values = [f"pmid-{index}" for index in range(_IdConvDiskCache._SELECT_CHUNK + 5)]
+    cache.store_records(
+        "pmid",
+        [{"requested-id": value, "pmcid": f"PMC{index}"} for index, value in enumerate(values)],
+    )
+
+    hits = cache.get_records(values)
+
+    assert len(hits) == len(values)
+    assert hits["pmid-0"]["pmcid"] == "PMC0"
+    assert hits[values[-1]]["pmcid"] == f"PMC{len(values) - 1}"
+
+
+def test_get_ids_by_type_skips_network_on_warm_cache(tmp_path, monkeypatch):
+    client = PubMedClient(
+        email="test@example.com",
+        tool="ingestion-workflow-tests",
+        cache_dir=tmp_path,
+    )
+    client._disk_cache.store_records(
+        "pmid",
+        [
+            {
+                "requested-id": "111",
+                "pmid": "111",
+                "pmcid": "PMC111",
+                "doi": "10.1234/cached",
+            }
+        ],
+    )
+
+    def _no_network(*_args, **_kwargs):
+        raise AssertionError("warm cache lookups must not reach the ID Converter")
+
+    monkeypatch.setattr(client, "_gather_idconv", _no_network)
+
+    identifiers = Identifiers([Identifier(pmid="111")])
+    client.get_ids_by_type("pmid", identifiers)
+
+    enriched = identifiers.identifiers[0]
+    assert enriched.pmcid == "PMC111"
+    assert enriched.doi == "10.1234/cached"
@@ -26,7 +26,7 @@ def _make_fake_article(*, doi=None, pmid=None, identifier_type="doi"):
     )
 
 
-def test_elsevier_download_mixed_success(monkeypatch, tmp_path):
+def test_elsevier_download_mixed_success(tmp_path):
     identifiers = Identifiers(
         [
             Identifier(doi="10.1234/failed"),
@@ -40,22 +40,32 @@ def test_elsevier_download_mixed_success(monkeypatch, tmp_path):
         data_root=tmp_path / "data",
     )
 
-    extractor = ElsevierExtractor(settings=settings)
-
-    def fake_run_download(self, records, progress_hook=None):
+    async def fake_download_articles(
+        records,
+        *,
+        client=None,
+        cache=None,
+        settings=None,
+        progress_callback=None,
+    ):
         assert len(records) == 3
-        articles = [
+        return [
             _make_fake_article(pmid="123456", identifier_type="pmid"),
             _make_fake_article(doi="10.1234/success", identifier_type="doi"),
         ]
-        if progress_hook:
-            for _ in articles:
-                progress_hook(1)
-        return articles
-
-    monkeypatch.setattr(ElsevierExtractor, "_run_download", fake_run_download)
 
-    results = extractor.download(identifiers)
+    # Inject the batch downloader through the constructor seam instead of
+    # patching module state; the dummy client keeps the extractor from
+    # building its own ScienceDirectClient.
+    extractor = ElsevierExtractor(
+        settings=settings,
+        client=object(),
+        downloader=fake_download_articles,
+    )
+    try:
+        results = extractor.download(identifiers)
+    finally:
+        extractor.close()
 
     assert len(results) == 3
 
@@ -72,7 +82,7 @@ def test_elsevier_download_mixed_success(monkeypatch, tmp_path):
     assert second.source is DownloadSource.ELSEVIER
     assert second.files
     metadata_file = next(file for file in second.files if file.file_type is FileType.JSON)
-    metadata = json.loads(metadata_file.file_path.read_text(encoding="utf-8"))
+    metadata = json.loads(metadata_file.file_path.read_bytes())
     assert metadata["lookup_type"] == "pmid"
     assert metadata["lookup_value"] == "123456"
     assert metadata["identifier_slug"] == second.identifier.slug
@@ -80,7 +90,7 @@ def test_elsevier_download_mixed_success(monkeypatch, tmp_path):
     assert third.identifier is identifiers.identifiers[2]
     assert third.success
     metadata_file = next(file for file in third.files if file.file_type is FileType.JSON)
-    metadata = json.loads(metadata_file.file_path.read_text(encoding="utf-8"))
+    metadata = json.loads(metadata_file.file_path.read_bytes())
     assert metadata["lookup_type"] == "doi"
     assert metadata["lookup_value"] == "10.1234/success"
     assert metadata["identifier_slug"] == third.identifier.slug
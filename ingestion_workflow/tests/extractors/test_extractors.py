@@ -50,7 +50,7 @@ def test_elsevier_download_records_articles(tmp_path, manifest_identifiers):
             assert result.files, "Successful downloads should persist files"
 
             metadata_file = next(file for file in result.files if file.file_type is FileType.JSON)
-            metadata = json.loads(metadata_file.file_path.read_text(encoding="utf-8"))
+            metadata = json.loads(metadata_file.file_path.read_bytes())
 
             expected_lookup_type = "doi" if identifier.doi else "pmid"
             expected_lookup_value = identifier.doi or identifier.pmid
@@ -145,7 +145,8 @@ def test_pubget_download_persists_article_and_tables(tmp_path, monkeypatch):
         settings.pubmed_api_key,
         settings.pubmed_batch_size,
     )
-    assert captured["extract"] == (download_dir, 3)
+    # n_jobs is capped at the number of PMCIDs in the batch.
+    assert captured["extract"] == (download_dir, 1)
 
     assert len(results) == 1
     result = results[0]
@@ -160,6 +161,22 @@ def test_pubget_download_persists_article_and_tables(tmp_path, monkeypatch):
     assert tables_dir.joinpath("table_000_info.json") in paths
     assert tables_dir.joinpath("table_000.csv") in paths
 
+    # A repeat run is served from the persistent article index without
+    # calling Pubget again.
+    def fail_download(*_args, **_kwargs):
+        raise AssertionError("download_pmcids should not run for cached PMCIDs")
+
+    monkeypatch.setattr(
+        "ingestion_workflow.extractors.pubget_extractor.download_pmcids",
+        fail_download,
+    )
+
+    repeat_results = extractor.download(identifiers)
+
+    assert len(repeat_results) == 1
+    assert repeat_results[0].success is True
+    assert {file.file_path for file in repeat_results[0].files} == paths
+
 
 def test_pubget_download_warns_on_incomplete_exit_codes(tmp_path, monkeypatch):
     identifier = Identifier(pmcid="PMC987")
@@ -286,7 +303,7 @@ def test_pubget_extract_translates_tables(tmp_path):
     manifest_path = tables_output_dir / "table_sources.json"
     assert manifest_path.exists()
 
-    sources = json.loads(manifest_path.read_text(encoding="utf-8"))
+    sources = json.loads(manifest_path.read_bytes())
     assert set(sources) == {"tbl0005", "tbl0010", "tbl0015"}
     for table_id, payload in sources.items():
         info_path = Path(payload["info_path"])
@@ -91,7 +91,7 @@ def test_build_article_export_round_trip(tmp_path: Path) -> None:
 
     processed_manifest = target / "processed" / bundle.article_data.source.value / "processed.json"
     assert processed_manifest.exists()
-    manifest_data = json.loads(processed_manifest.read_text(encoding="utf-8"))
+    manifest_data = json.loads(processed_manifest.read_bytes())
     assert manifest_data["article_data"]["slug"] == bundle.article_data.slug
     analysis_entry = manifest_data["article_data"]["analyses"][0]
     assert analysis_entry["table_id"] == "Table A"
@@ -99,7 +99,7 @@ def test_build_article_export_round_trip(tmp_path: Path) -> None:
 
     source_manifest = target / "source" / bundle.article_data.source.value / "source.json"
     assert source_manifest.exists()
-    source_data = json.loads(source_manifest.read_text(encoding="utf-8"))
+    source_data = json.loads(source_manifest.read_bytes())
     assert source_data["source"] == bundle.article_data.source.value
     assert source_data["tables"][0]["table_id"] == "Table A"
     assert source_data["raw_downloads"] == []
@@ -70,12 +70,12 @@ def test_export_writes_structure(tmp_path):
 
     processed_manifest = root / "processed" / bundle.article_data.source.value / "processed.json"
     assert processed_manifest.exists()
-    processed_content = json.loads(processed_manifest.read_text(encoding="utf-8"))
+    processed_content = json.loads(processed_manifest.read_bytes())
     assert processed_content["article_data"]["tables"][0]["table_id"] == "Table A"
 
     source_manifest = root / "source" / bundle.article_data.source.value / "source.json"
     assert source_manifest.exists()
-    source_content = json.loads(source_manifest.read_text(encoding="utf-8"))
+    source_content = json.loads(source_manifest.read_bytes())
     assert source_content["tables"][0]["table_id"] == "Table A"
     assert source_content["raw_downloads"] == []
 
@@ -130,12 +130,12 @@ def test_export_writes_analyses_jsonl(tmp_path):
         / bundle.article_data.source.value
         / "processed.json"
     )
-    manifest_payload = json.loads(processed_manifest.read_text(encoding="utf-8"))
+    manifest_payload = json.loads(processed_manifest.read_bytes())
     analysis_entry = manifest_payload["article_data"]["analyses"][0]
     assert analysis_entry["jsonl_path"] is not None
     analysis_path = Path(analysis_entry["jsonl_path"])
     assert analysis_path.exists()
-    payload = json.loads(analysis_path.read_text(encoding="utf-8"))
+    payload = json.loads(analysis_path.read_bytes())
     assert payload["analyses"][0]["name"] == "analysis"
 
 
@@ -20,6 +20,7 @@ from ingestion_workflow.models import (
     Identifier,
     Identifiers,
 )
+from ingestion_workflow.services import cache
 from ingestion_workflow.workflow import orchastrator
 
 
@@ -252,3 +253,59 @@ def test_gather_stage_combines_manifest(monkeypatch, tmp_path):
 
     assert seen["manifest"] == manifest
     assert state.identifiers is returned_identifiers
+
+
+def test_hydrate_downloads_prefers_first_source_and_preserves_order(tmp_path):
+    settings = Settings(
+        cache_root=tmp_path / "cache",
+        data_root=tmp_path / "data",
+        download_sources=[
+            DownloadSource.ELSEVIER.value,
+            DownloadSource.PUBGET.value,
+        ],
+    )
+    identifiers = Identifiers(
+        [
+            Identifier(pmid="111"),
+            Identifier(pmid="222"),
+            Identifier(pmid="333"),
+        ]
+    )
+    _first, second, third = identifiers.identifiers
+
+    cache.cache_download_results(
+        settings,
+        extractor_name=DownloadSource.PUBGET.value,
+        results=[
+            DownloadResult(
+                identifier=second,
+                source=DownloadSource.PUBGET,
+                success=True,
+            ),
+            DownloadResult(
+                identifier=third,
+                source=DownloadSource.PUBGET,
+                success=True,
+            ),
+        ],
+    )
+    cache.cache_download_results(
+        settings,
+        extractor_name=DownloadSource.ELSEVIER.value,
+        results=[
+            DownloadResult(
+                identifier=third,
+                source=DownloadSource.ELSEVIER,
+                success=True,
+            ),
+        ],
+    )
+
+    hydrated = orchastrator._hydrate_downloads_from_cache(settings, identifiers)
+
+    # Output follows the caller's identifier order, not set iteration order.
+    assert [result.identifier.slug for result in hydrated] == [second.slug, third.slug]
+    # Both sources cache the third identifier; the earlier source wins.
+    by_slug = {result.identifier.slug: result for result in hydrated}
+    assert by_slug[third.slug].source is DownloadSource.ELSEVIER
+    assert by_slug[second.slug].source is DownloadSource.PUBGET
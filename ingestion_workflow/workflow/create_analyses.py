@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from typing import Callable, Dict, List, Sequence, Tuple
 
 from ingestion_workflow.config import Settings
@@ -222,21 +222,18 @@ def _run_bundle_with_cache(
             "sanitized": sanitized_table_id,
             "cache_key": cache_key,
             "table_number": table.table_number,
-            "table_metadata": dict(table.metadata),
+            # Stored by reference; _process_pending_job copies it only for
+            # tables that actually produce a cacheable result.
+            "table_metadata": table.metadata,
         }
 
     if not pending_tables:
         return table_results, bundle_results, None, stats
 
-    pruned_content = replace(bundle.article_data, tables=list(pending_tables))
-    pruned_bundle = ArticleExtractionBundle(
-        article_data=pruned_content,
-        article_metadata=bundle.article_metadata,
-    )
-
     pending_job = PendingJob(
         article_slug=article_slug,
-        bundle=pruned_bundle,
+        bundle=bundle,
+        tables=pending_tables,
         pending_info=pending_info,
         table_results=table_results,
         bundle_records=bundle_results,
@@ -245,13 +242,14 @@ def _run_bundle_with_cache(
 
 
 def _compose_cache_key(article_slug: str, sanitized_table_id: str) -> str:
-    return f"{article_slug}::{sanitized_table_id}"
+    return article_slug + "::" + sanitized_table_id
 
 
 @dataclass
 class PendingJob:
     article_slug: str
     bundle: ArticleExtractionBundle
+    tables: List[ExtractedTable]
     pending_info: Dict[str, Dict[str, object]]
     table_results: Dict[str, AnalysisCollection]
     bundle_records: List[CreateAnalysesResult]
@@ -274,7 +272,11 @@ def _process_pending_job(
         settings,
         extractor_name=extractor_name,
     )
-    new_results = service.run(job.bundle, progress_hook=progress_hook)
+    new_results = service.run(
+        job.bundle,
+        progress_hook=progress_hook,
+        tables=job.tables,
+    )
     produced: List[CreateAnalysesResult] = []
     for table_key, collection in new_results.items():
         info = job.pending_info.get(table_key)
@@ -288,7 +290,7 @@ def _process_pending_job(
             sanitized_table_id=info["sanitized"],
             analysis_collection=collection,
             metadata={
-                "table_metadata": info["table_metadata"],
+                "table_metadata": dict(info["table_metadata"]),
                 "table_number": info["table_number"],
             },
         )
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import logging
-from typing import Callable, Dict, Iterable, List, Sequence
+import operator
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Tuple
 
 from ingestion_workflow.config import Settings
 from ingestion_workflow.extractors import (
@@ -55,27 +59,64 @@ EXTRACTOR_FACTORIES: Dict[DownloadSource, ExtractorFactory] = {
 }
 
 
+# Extractors constructed per (source, settings) pair; entries are evicted
+# when the settings object they were built for is garbage collected.
+_EXTRACTOR_CACHE: Dict[Tuple[DownloadSource, int], Tuple[weakref.ref, BaseExtractor]] = {}
+
+
 def _resolve_extractor(source: DownloadSource, settings: Settings) -> BaseExtractor:
-    """Resolve the configured extractor implementation for a download source."""
+    """Resolve the configured extractor implementation for a download source.
+
+    Instances are memoized per (source, settings) pair so repeated pipeline
+    runs with the same settings reuse the extractor's HTTP sessions and
+    connection pools instead of rebuilding them each call.
+    """
+    key = (source, id(settings))
+    cached = _EXTRACTOR_CACHE.get(key)
+    if cached is not None:
+        settings_ref, extractor = cached
+        if settings_ref() is settings:
+            return extractor
     try:
         factory = EXTRACTOR_FACTORIES[source]
     except KeyError as exc:  # pragma: no cover - defensive guard
         message = f"No extractor registered for source: {source}"
         raise ValueError(message) from exc
-    return factory(settings)
+    extractor = factory(settings)
+    _EXTRACTOR_CACHE[key] = (
+        weakref.ref(settings, lambda _ref, _key=key: _EXTRACTOR_CACHE.pop(_key, None)),
+        extractor,
+    )
+    return extractor
 
 
-def _successful_slugs(results: Sequence[DownloadResult]) -> set[str]:
-    """Return the slugs for successful download results."""
-    return {result.identifier.slug for result in results if result.success}
+def _supported_ids_predicate(extractor: BaseExtractor) -> Callable[[Identifier], bool]:
+    """Return a test for whether an identifier carries a supported ID field.
+
+    The predicate is built once per extractor class from ``_SUPPORTED_IDS``
+    using :func:`operator.attrgetter`, so the per-identifier check avoids
+    repeated string-based ``getattr`` calls in the partition loop.
+    """
+    cls = type(extractor)
+    # Look in the class's own dict so subclasses never inherit a cache built
+    # for a sibling's field set.
+    predicate = cls.__dict__.get("_SUPPORTED_IDS_PREDICATE")
+    if predicate is None:
+        fields = tuple(sorted(str(field) for field in extractor._SUPPORTED_IDS))
+        if len(fields) == 1:
+            getter = operator.attrgetter(fields[0])
+
+            def predicate(identifier: Identifier, _get=getter) -> bool:
+                return bool(_get(identifier))
+
+        else:
+            getter = operator.attrgetter(*fields)
 
+            def predicate(identifier: Identifier, _get=getter) -> bool:
+                return any(_get(identifier))
 
-def _identifiers_from_slugs(
-    pending: Iterable[Identifier],
-    success_slugs: set[str],
-) -> List[Identifier]:
-    """Filter pending identifiers to those whose slugs are not in the successes set."""
-    return [identifier for identifier in pending if identifier.slug not in success_slugs]
+        cls._SUPPORTED_IDS_PREDICATE = predicate
+    return predicate
 
 
 def _partition_supported_identifiers(
@@ -85,15 +126,15 @@ def _partition_supported_identifiers(
     supported_fields = getattr(extractor, "_SUPPORTED_IDS", None)
     identifiers_list = list(identifiers)
 
-    if not supported_fields:
+    if getattr(extractor, "_SUPPORTS_ALL", False) or not supported_fields:
         return identifiers_list, []
 
-    field_set = {str(field) for field in supported_fields}
+    is_supported = _supported_ids_predicate(extractor)
     supported: list[Identifier] = []
     unsupported: list[Identifier] = []
 
     for identifier in identifiers_list:
-        if any(getattr(identifier, field, None) for field in field_set):
+        if is_supported(identifier):
             supported.append(identifier)
         else:
             unsupported.append(identifier)
@@ -101,6 +142,115 @@ def _partition_supported_identifiers(
     return supported, unsupported
 
 
+def _extractor_supports(extractor: BaseExtractor, identifier: Identifier) -> bool:
+    """Check whether an identifier carries a field the extractor accepts."""
+    if getattr(extractor, "_SUPPORTS_ALL", False):
+        return True
+    if not getattr(extractor, "_SUPPORTED_IDS", None):
+        return True
+    return _supported_ids_predicate(extractor)(identifier)
+
+
+@dataclass
+class _SourceOutcome:
+    """Results and bookkeeping from one source's download attempt."""
+
+    results: List[DownloadResult] = field(default_factory=list)
+    failures: List[Identifier] = field(default_factory=list)
+    cache_hits: int = 0
+
+
+def _run_source(
+    settings: Settings,
+    source: DownloadSource,
+    extractor: BaseExtractor,
+    pending: List[Identifier],
+) -> _SourceOutcome:
+    """Serve one source's identifiers from cache, then download the rest."""
+    outcome = _SourceOutcome()
+
+    # Identifiers stores the list by reference and callers own the pending
+    # list, so no defensive copy is needed.
+    cached_results, missing = cache.partition_cached_downloads(
+        settings,
+        extractor_name=source.value,
+        identifiers=Identifiers(pending),
+    )
+    outcome.results.extend(cached_results)
+    outcome.cache_hits = len(cached_results)
+    if outcome.cache_hits:
+        logger.info(
+            "Download[%s] loaded %d identifiers from cache",
+            source.value,
+            outcome.cache_hits,
+            extra=console_kwargs(),
+        )
+
+    if not missing:
+        return outcome
+
+    pending_count = len(missing)
+    if settings.cache_only_mode:
+        logger.info(
+            "Download[%s] skipping %d identifiers (cache-only mode)",
+            source.value,
+            pending_count,
+            extra=console_kwargs(),
+        )
+        outcome.failures.extend(missing)
+        return outcome
+
+    logger.info(
+        "Download[%s] processing %d identifiers",
+        source.value,
+        pending_count,
+        extra=console_kwargs(),
+    )
+
+    progress = create_progress_bar(
+        settings,
+        pending_count,
+        f"Download[{source.value}]",
+        unit="article",
+    )
+
+    progress_hook = progress_callback(progress)
+    try:
+        download_results = extractor.download(
+            Identifiers(missing),
+            progress_hook=progress_hook,
+        )
+    finally:
+        if progress is not None:
+            progress.close()
+
+    # Split successes from failures in the same pass that collects the
+    # results so each identifier is only inspected once.
+    successes: List[DownloadResult] = []
+    for result in download_results:
+        outcome.results.append(result)
+        if result.success:
+            successes.append(result)
+        else:
+            outcome.failures.append(result.identifier)
+
+    if successes:
+        cache.cache_download_results(
+            settings,
+            extractor_name=source.value,
+            results=successes,
+        )
+
+    logger.info(
+        "Download[%s] successes: %d/%d",
+        source.value,
+        len(successes),
+        pending_count,
+        extra=console_kwargs(),
+    )
+    return outcome
+
+
 def run_downloads(
     identifiers: Identifiers,
     *,
@@ -111,129 +261,87 @@ def run_downloads(
     Run configured download sources in order,
     using cache where possible,
     and persist successful payloads.
+
+    Identifiers that only one configured source can serve are dispatched to
+    their sources concurrently, since those batches hit disjoint remote
+    hosts. Identifiers with several candidate sources keep the sequential
+    precedence order so fallback semantics are unchanged.
     """
 
     resolved_settings = resolve_settings(settings)
-    remaining: List[Identifier] = list(identifiers.identifiers)
-    collected_results: List[DownloadResult] = []
-    total_requested = len(remaining)
-    successful_slugs: set[str] = set()
-
-    for source_name in resolved_settings.download_sources:
-        if not remaining:
-            break
-
-        source = DownloadSource(source_name)
-        extractor = _resolve_extractor(source, resolved_settings)
-
-        supported, unsupported = _partition_supported_identifiers(extractor, remaining)
-        if not supported:
-            remaining = list(unsupported)
-            continue
-
-        extractor_identifiers = Identifiers(list(supported))
-        cached_results, missing = cache.partition_cached_downloads(
-            resolved_settings,
-            extractor_name=source.value,
-            identifiers=extractor_identifiers,
-        )
-        collected_results.extend(cached_results)
-        successful_slugs.update(
-            result.identifier.slug
-            for result in cached_results
-            if result.success and result.identifier
-        )
-
-        cached_count = len(cached_results)
-        if metrics is not None and cached_count:
-            metrics.record_cache_hits(cached_count)
-        unsupported_count = len(unsupported)
-        pending_count = len(missing)
-        if cached_count:
-            logger.info(
-                "Download[%s] loaded %d identifiers from cache",
-                source.value,
-                cached_count,
-                extra=console_kwargs(),
-            )
-        if unsupported_count:
-            logger.info(
-                "Download[%s] skipping %d unsupported identifiers",
-                source.value,
-                unsupported_count,
-                extra=console_kwargs(),
-            )
-
-        next_remaining: List[Identifier] = list(unsupported)
-
-        if not missing:
-            remaining = next_remaining
-            continue
-
-        if resolved_settings.cache_only_mode:
-            if pending_count:
-                logger.info(
-                    "Download[%s] skipping %d identifiers (cache-only mode)",
-                    source.value,
-                    pending_count,
-                    extra=console_kwargs(),
-                )
-            next_remaining.extend(missing)
-            remaining = next_remaining
+    total_requested = len(identifiers.identifiers)
+    sources = [DownloadSource(name) for name in resolved_settings.download_sources]
+    extractors = {source: _resolve_extractor(source, resolved_settings) for source in sources}
+
+    exclusive: Dict[DownloadSource, List[Identifier]] = {}
+    shared: List[Identifier] = []
+    for identifier in identifiers.identifiers:
+        supporting = [
+            source for source in sources if _extractor_supports(extractors[source], identifier)
+        ]
+        if not supporting:
             continue
+        if len(supporting) == 1:
+            exclusive.setdefault(supporting[0], []).append(identifier)
+        else:
+            shared.append(identifier)
 
+    skipped = total_requested - (len(shared) + sum(len(batch) for batch in exclusive.values()))
+    if skipped:
         logger.info(
-            "Download[%s] processing %d identifiers",
-            source.value,
-            pending_count,
+            "Download skipping %d identifiers unsupported by all sources",
+            skipped,
             extra=console_kwargs(),
         )
 
-        progress = create_progress_bar(
-            resolved_settings,
-            pending_count,
-            f"Download[{source.value}]",
-            unit="article",
-        )
-
-        progress_hook = progress_callback(progress)
-        try:
-            download_results = extractor.download(
-                Identifiers(list(missing)),
-                progress_hook=progress_hook,
-            )
-        finally:
-            if progress is not None:
-                progress.close()
-
-        for result in download_results:
-            collected_results.append(result)
-
-        successes = [result for result in download_results if result.success]
-        if successes:
-            cache.cache_download_results(
-                resolved_settings,
-                extractor_name=source.value,
-                results=successes,
-            )
-
-        successful_slugs.update(
-            result.identifier.slug for result in successes if result.identifier
-        )
+    outcomes: Dict[DownloadSource, List[_SourceOutcome]] = {source: [] for source in sources}
 
-        success_slugs = _successful_slugs(successes)
-        failures = _identifiers_from_slugs(missing, success_slugs)
-        next_remaining.extend(failures)
-        remaining = next_remaining
-
-        logger.info(
-            "Download[%s] successes: %d/%d",
-            source.value,
-            len(successes),
-            pending_count,
-            extra=console_kwargs(),
+    if len(exclusive) == 1:
+        source, pending = next(iter(exclusive.items()))
+        outcomes[source].append(
+            _run_source(resolved_settings, source, extractors[source], pending)
         )
-
+    elif exclusive:
+        with ThreadPoolExecutor(max_workers=len(exclusive)) as executor:
+            future_map = {
+                executor.submit(
+                    _run_source, resolved_settings, source, extractors[source], pending
+                ): source
+                for source, pending in exclusive.items()
+            }
+            for future in as_completed(future_map):
+                outcomes[future_map[future]].append(future.result())
+
+    remaining = shared
+    for source in sources:
+        if not remaining:
+            break
+        supported, unsupported = _partition_supported_identifiers(extractors[source], remaining)
+        if not supported:
+            remaining = unsupported
+            continue
+        outcome = _run_source(resolved_settings, source, extractors[source], supported)
+        outcomes[source].append(outcome)
+        # The partition output is owned here, so extend it in place rather
+        # than concatenating into yet another list.
+        unsupported.extend(outcome.failures)
+        remaining = unsupported
+
+    # Merge per-source outcomes in precedence order so the collected results
+    # stay deterministic regardless of thread completion order.
+    collected_results: List[DownloadResult] = []
+    successful_slugs: set[str] = set()
+    cache_hits = 0
+    for source in sources:
+        for outcome in outcomes[source]:
+            cache_hits += outcome.cache_hits
+            for result in outcome.results:
+                collected_results.append(result)
+                if result.success and result.identifier:
+                    successful_slugs.add(result.identifier.slug)
+
+    if metrics is not None and cache_hits:
+        metrics.record_cache_hits(cache_hits)
     if total_requested:
         log_success("download", len(successful_slugs), total_requested)
     if metrics is not None:
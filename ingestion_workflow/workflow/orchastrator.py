@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import functools
+import importlib
 import logging
+import sys
+import types
+from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Sequence
@@ -34,6 +39,10 @@ CANONICAL_STAGES: List[str] = [
     "sync",
 ]
 
+# Frozen companion set for O(1) membership checks; the list above keeps the
+# canonical execution order.
+_CANONICAL_STAGES_SET = frozenset(CANONICAL_STAGES)
+
 
 @dataclass
 class PipelineState:
@@ -80,14 +89,29 @@ def run_pipeline(
     return state
 
 
+def _stage_module(name: str) -> types.ModuleType:
+    """Resolve a workflow stage module at call time.
+
+    Stage modules are imported lazily so the CLI does not pay for every
+    stage's dependency graph at startup and so tests can stub a stage by
+    swapping its entry in ``sys.modules``. Once a module is loaded this is a
+    single dict probe rather than a full import-system traversal.
+    """
+    qualified = f"ingestion_workflow.workflow.{name}"
+    module = sys.modules.get(qualified)
+    if module is not None:
+        return module
+    return importlib.import_module(qualified)
+
+
 def _run_gather_stage(settings: Settings, state: PipelineState) -> None:
     if settings.dry_run:
         logger.info("Dry-run enabled: gather stage skipped.")
         return
-    from ingestion_workflow.workflow.gather import gather_identifiers
-
     manifest = settings.manifest_path
-    identifiers = gather_identifiers(settings=settings, manifest=manifest)
+    identifiers = _stage_module("gather").gather_identifiers(
+        settings=settings, manifest=manifest
+    )
     state.identifiers = identifiers
 
 
@@ -96,10 +120,8 @@ def _run_download_stage(settings: Settings, state: PipelineState) -> None:
         logger.info("Dry-run enabled: download stage skipped.")
         return
     _ensure_identifiers(settings, state)
-    from ingestion_workflow.workflow.download import run_downloads
-
     download_metrics = StageMetrics()
-    downloads = run_downloads(
+    downloads = _stage_module("download").run_downloads(
         state.identifiers,
         settings=settings,
         metrics=download_metrics,
@@ -113,8 +135,6 @@ def _run_extract_stage(settings: Settings, state: PipelineState) -> None:
         logger.info("Dry-run enabled: extract stage skipped.")
         return
     _ensure_downloads(settings, state)
-    from ingestion_workflow.workflow.extract import run_extraction
-
     successful_downloads = [download for download in state.downloads or [] if download.success]
 
     if not successful_downloads:
@@ -124,7 +144,7 @@ def _run_extract_stage(settings: Settings, state: PipelineState) -> None:
         return
 
     extract_metrics = StageMetrics()
-    bundles = run_extraction(
+    bundles = _stage_module("extract").run_extraction(
         successful_downloads,
         settings=settings,
         metrics=extract_metrics,
@@ -138,10 +158,8 @@ def _run_create_analyses_stage(settings: Settings, state: PipelineState) -> None
         logger.info("Dry-run enabled: create_analyses stage skipped.")
         return
     _ensure_bundles(settings, state)
-    from ingestion_workflow.workflow.create_analyses import run_create_analyses
-
     analyses_metrics = StageMetrics()
-    analyses = run_create_analyses(
+    analyses = _stage_module("create_analyses").run_create_analyses(
         state.bundles,
         settings=settings,
         extractor_name=None,
@@ -161,7 +179,7 @@ def _run_sync_stage(settings: Settings, state: PipelineState) -> None:
 
 def _normalize_stages(stages: Sequence[str] | None) -> List[str]:
     requested = [stage.lower() for stage in stages if stage] if stages else list(CANONICAL_STAGES)
-    invalid = [stage for stage in requested if stage not in CANONICAL_STAGES]
+    invalid = [stage for stage in requested if stage not in _CANONICAL_STAGES_SET]
     if invalid:
         raise ValueError(f"Unknown stages requested: {', '.join(sorted(set(invalid)))}")
     requested_set = set(requested) or set(CANONICAL_STAGES)
@@ -317,15 +335,28 @@ def _hydrate_downloads_from_cache(
 ) -> List[DownloadResult]:
     if identifiers is None or not identifiers.identifiers:
         return []
+    ordered_slugs = [identifier.slug for identifier in identifiers.identifiers]
+    remaining = set(ordered_slugs)
     hydrated: Dict[str, DownloadResult] = {}
     for source_name in settings.download_sources:
+        if not remaining:
+            # Every identifier is already hydrated; skip the remaining
+            # indices entirely rather than loading them just to find that.
+            break
         index = cache.load_download_index(settings, source_name)
-        for identifier in identifiers.identifiers:
-            entry = index.get_download(identifier.slug)
-            if entry is None:
-                continue
-            hydrated[identifier.slug] = entry.result
-    return list(hydrated.values())
+        # Intersect still-missing slugs with the index keys so only actual
+        # hits pay for a payload decode. Sources are consulted in precedence
+        # order and hydrated slugs leave ``remaining``, so when several
+        # sources cache the same slug the first one wins — the same
+        # precedence run_downloads applies when fetching fresh.
+        for slug in remaining & index.slugs():
+            entry = index.get_download(slug)
+            if entry is not None:
+                hydrated[slug] = entry.result
+        remaining -= hydrated.keys()
+    # Emit results in the caller's identifier order; the set iteration above
+    # is hash-ordered and would otherwise vary from process to process.
+    return [hydrated[slug] for slug in ordered_slugs if slug in hydrated]
 
 
 def _hydrate_bundles_from_cache(
@@ -336,14 +367,16 @@ def _hydrate_bundles_from_cache(
         return []
 
     bundles: Dict[str, ArticleExtractionBundle] = {}
-    downloads_by_source: Dict[str, List[DownloadResult]] = {}
+    downloads_by_source: defaultdict[str, List[DownloadResult]] = defaultdict(list)
     for download in downloads:
-        downloads_by_source.setdefault(download.source.value, []).append(download)
+        downloads_by_source[download.source.value].append(download)
 
     for source_name, download_list in downloads_by_source.items():
         index = cache.load_extractor_index(settings, source_name)
+        # One bulk read per source instead of a SQLite round trip per slug.
+        entries = index.get_many([download.identifier.slug for download in download_list])
         for download in download_list:
-            entry = index.get_extraction(download.identifier.slug)
+            entry = entries.get(download.identifier.slug)
             if entry is None:
                 continue
             content = entry.content
@@ -356,14 +389,33 @@ def _hydrate_bundles_from_cache(
     return list(bundles.values())
 
 
-def _build_placeholder_metadata(identifier: Identifier) -> ArticleMetadata:
-    for candidate in (identifier.doi, identifier.pmid, identifier.pmcid):
+@functools.lru_cache(maxsize=4096)
+def _placeholder_title(
+    doi: str | None,
+    pmid: str | None,
+    pmcid: str | None,
+    slug: str,
+) -> str:
+    for candidate in (doi, pmid, pmcid):
         if candidate:
-            return ArticleMetadata(title=str(candidate))
-    label = " / ".join(part for part in identifier.slug.split("|") if part)
+            return str(candidate)
+    label = " / ".join(part for part in slug.split("|") if part)
     if label:
-        return ArticleMetadata(title=label)
-    return ArticleMetadata(title=identifier.slug or "Unknown Identifier")
+        return label
+    return slug or "Unknown Identifier"
+
+
+def _build_placeholder_metadata(identifier: Identifier) -> ArticleMetadata:
+    # The derived title is memoized per identifier; ArticleMetadata itself is
+    # a mutable dataclass, so each bundle still gets its own instance.
+    return ArticleMetadata(
+        title=_placeholder_title(
+            identifier.doi,
+            identifier.pmid,
+            identifier.pmcid,
+            identifier.slug,
+        )
+    )
 
 
 def _configure_logging_for_run(settings: Settings) -> None: